@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
-from typing import Any, Dict, List, Optional
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # pragma: no cover - orjson is an optional speed-up for the kickoff scripts.
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json.
+    orjson = None
 
 from resume_screening_rag_automation.core.py_models import (
     AppState,
@@ -25,6 +33,8 @@ USE_MEM0_MEMORY = os.getenv("RESUME_ASSISTANT_USE_MEM0", "").strip().lower() in
     "true",
     "yes",
 }
+PRINT_SCENARIO_OUTPUT = os.getenv("HIREX_KICKOFF_PRINT", "0") == "1"
+_PHASE_BY_VALUE: Dict[str, ConversationPhase] = {phase.value: phase for phase in ConversationPhase}
 
 SCENARIOS: List[Dict[str, Any]] = [
     {
@@ -357,25 +367,120 @@ SCENARIOS: List[Dict[str, Any]] = [
     },
 ]
 
-def _print_result(result: Any) -> None:
-    """Pretty-print the task output from a crew kickoff."""
+
+def _dumps_indent2(obj: Any) -> str:
+    """Serialise ``obj`` as indented UTF-8 JSON, using orjson when available."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:  # pragma: no cover - fall back for types orjson rejects
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialise ``obj`` as whitespace-free JSON for prompt inputs."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:  # pragma: no cover - fall back for types orjson rejects
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _emit(*lines: str) -> None:
+    """Write ``lines`` to stdout in a single call."""
+
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+def _format_result(result: Any) -> str:
+    """Pretty-format the task output from a crew kickoff."""
 
     payload = getattr(result, "pydantic", None)
     if payload is not None:
-        print(payload.model_dump_json(indent=2))
-        return
+        return payload.model_dump_json(indent=2)
 
     json_dict = getattr(result, "json_dict", None)
     if json_dict is not None:
-        print(json.dumps(json_dict, indent=2, ensure_ascii=False))
-        return
+        return _dumps_indent2(json_dict)
 
     raw = getattr(result, "raw", None)
     if raw:
-        print(raw)
-        return
+        return raw
+
+    return str(result)
+
+
+@dataclass(frozen=True)
+class _ScenarioInputs:
+    """Session-independent kickoff payload derived from a scenario."""
+
+    input_controls: Dict[str, Any]
+    history: Tuple[ChatMessage, ...]
+    inputs: Dict[str, str]
+
+
+def _prepare_scenario(scenario: Dict[str, Any]) -> _ScenarioInputs:
+    controls = QueryControls(**scenario["controls"])
+    input_controls = controls.model_dump()
+
+    history: List[ChatMessage] = []
+    conversation_history: List[Dict[str, Any]] = []
+    for history_item in scenario.get("history", []):
+        phase_value = history_item.get("phase")
+        message = ChatMessage(
+            role=history_item.get("role", "assistant"),
+            content_md=history_item.get("content", ""),
+            phase=_PHASE_BY_VALUE.get(phase_value or ""),
+        )
+        history.append(message)
+        conversation_history.append(
+            {
+                "role": message.role,
+                "phase": phase_value,
+                "timestamp": history_item.get("timestamp"),
+                "content": message.content_md,
+            }
+        )
 
-    print(result)
+    current_message = ChatMessage(role="user", content_md=scenario["user_query"])
+    history.append(current_message)
+
+    # QueryControls constrains both fields to valid phase literals already,
+    # so a plain lookup replaces re-validating through the enum constructor.
+    last_phase_raw: Optional[str] = controls.last_completed_phase
+    routing_state = AppState(
+        job_description=None,
+        candidate_insights=[],
+        last_completed_phase=_PHASE_BY_VALUE.get(last_phase_raw or ""),
+        pending_phases=[_PHASE_BY_VALUE[phase] for phase in controls.phase_sequence],
+        query_controls=controls,
+    )
+    conversation_history.append(
+        {
+            "role": current_message.role,
+            "phase": last_phase_raw,
+            "timestamp": None,
+            "content": current_message.content_md,
+        }
+    )
+
+    return _ScenarioInputs(
+        input_controls=input_controls,
+        history=tuple(history),
+        inputs={
+            "user_query": scenario["user_query"],
+            "last_phase": last_phase_raw or "",
+            "previous_plan": scenario.get("previous_plan", ""),
+            # Prompt-only payloads are sent compact: indentation is pure token overhead.
+            "query_control": _dumps_compact(input_controls),
+            "state": routing_state.model_dump_json(),
+            "conversation_history": _dumps_compact(conversation_history),
+        },
+    )
 
 
 def main(num_scenarios: Optional[int] = None) -> None:
@@ -390,95 +495,32 @@ def main(num_scenarios: Optional[int] = None) -> None:
         indices = random.sample(range(len(SCENARIOS)), num_scenarios)
         selected_scenarios = [(idx + 1, SCENARIOS[idx]) for idx in sorted(indices)]
     
-    print(f"Running {len(selected_scenarios)} out of {len(SCENARIOS)} scenarios")
+    _emit(f"Running {len(selected_scenarios)} out of {len(SCENARIOS)} scenarios")
     
     summaries: List[Dict[str, Any]] = []
     for idx, scenario in selected_scenarios:
+        # Built per run so no model instances are shared between runs.
+        prepared = _prepare_scenario(scenario)
         session_id = f"kickoff-demo-{idx}"
-        controls = QueryControls(**scenario["controls"])
         memory_bundle: SessionMemoryBundle = create_session_memory_bundle(
             session_id,
             use_mem0=USE_MEM0_MEMORY,
         )
         memory_bundle.activate()
-        conversation_history_entries = []
-        for history_item in scenario.get("history", []):
-            phase_value = history_item.get("phase")
-            phase_enum: Optional[ConversationPhase] = None
-            if phase_value:
-                try:
-                    phase_enum = ConversationPhase(phase_value)
-                except ValueError:
-                    phase_enum = None
-            message = ChatMessage(
-                role=history_item.get("role", "assistant"),
-                content_md=history_item.get("content", ""),
-                phase=phase_enum,
-            )
+        for message in prepared.history:
             memory_bundle.record_message(message)
-            conversation_history_entries.append(
-                {
-                    "role": message.role,
-                    "phase": phase_value,
-                    "timestamp": history_item.get("timestamp"),
-                    "content": message.content_md,
-                }
-            )
-
-        current_message = ChatMessage(role="user", content_md=scenario["user_query"])
-        memory_bundle.record_message(current_message)
         manager = QueryManagerCrew(
             session_id=session_id,
             memory_kwargs=memory_bundle.crew_kwargs(),
         )
         crew = manager.crew()
 
-        print(f"\n=== Scenario {idx}: {scenario['name']} ===")
-        print(f"User query: {scenario['user_query']}")
-        print("Input controls:")
-        print(controls.model_dump_json(indent=2))
-
-        last_phase_raw: Optional[str] = controls.last_completed_phase
-        last_phase_enum = None
-        if last_phase_raw:
-            try:
-                last_phase_enum = ConversationPhase(last_phase_raw)
-            except ValueError:
-                last_phase_enum = None
-
-        pending_phases = []
-        for phase in controls.phase_sequence or []:
-            try:
-                pending_phases.append(ConversationPhase(phase))
-            except ValueError:
-                continue
-
-        routing_state = AppState(
-            job_description=None,
-            candidate_insights=[],
-            last_completed_phase=last_phase_enum,
-            pending_phases=pending_phases,
-            query_controls=controls,
-        )
-
-        conversation_history = conversation_history_entries + [
-            {
-                "role": current_message.role,
-                "phase": last_phase_raw,
-                "timestamp": None,
-                "content": current_message.content_md,
-            }
-        ]
+        _emit(f"\n=== Scenario {idx}: {scenario['name']} ===", f"User query: {scenario['user_query']}")
+        if PRINT_SCENARIO_OUTPUT:
+            _emit("Input controls:", _dumps_indent2(prepared.input_controls))
 
-        inputs = {
-            "user_query": scenario["user_query"],
-            "last_phase": last_phase_raw or "",
-            "previous_plan": scenario.get("previous_plan", ""),
-            "query_control": controls.model_dump_json(indent=2),
-            "session_id": session_id,
-            "state": json.dumps(routing_state.model_dump(mode="json"), indent=2, ensure_ascii=False),
-            "conversation_history": json.dumps(conversation_history, indent=2, ensure_ascii=False),
-        }
+        input_controls = prepared.input_controls
+        inputs = dict(prepared.inputs, session_id=session_id)
 
         result = crew.kickoff(inputs=inputs)
 
@@ -499,8 +541,9 @@ def main(num_scenarios: Optional[int] = None) -> None:
                     pass
         
         if payload is None:
-            print(f"Failed to parse output for scenario {idx}")
-            _print_result(result)
+            _emit(f"Failed to parse output for scenario {idx}")
+            if PRINT_SCENARIO_OUTPUT:
+                _emit(_format_result(result))
             continue
 
         output_controls = payload.query_controls.model_dump()
@@ -534,7 +577,7 @@ def main(num_scenarios: Optional[int] = None) -> None:
         summaries.append(
             {
                 "name": scenario["name"],
-                "input_controls": controls.model_dump(),
+                "input_controls": input_controls,
                 "output_controls": output_controls,
                 "expected_phases": expected_phases,
                 "expected_flags": expected_flags,
@@ -546,7 +589,8 @@ def main(num_scenarios: Optional[int] = None) -> None:
             }
         )
 
-        _print_result(result)
+        if PRINT_SCENARIO_OUTPUT:
+            _emit(_format_result(result))
 
     if summaries:
         total = len(summaries)
@@ -555,34 +599,35 @@ def main(num_scenarios: Optional[int] = None) -> None:
             for item in summaries
             if item["phase_match"] and not item["flag_mismatches"] and item["top_k_match"]
         )
-        print(f"\n=== Scenario Summary ({matched}/{total} matched expectations) ===")
+        summary_buffer = io.StringIO()
+        print(f"\n=== Scenario Summary ({matched}/{total} matched expectations) ===", file=summary_buffer)
         for item in summaries:
             status = "PASS" if item["phase_match"] and not item["flag_mismatches"] else "CHECK"
-            print(f"{item['name']} -> {status}")
-            print(f"  input phases:  {item['input_controls'].get('phase_sequence')}")
-            print(f"  output phases: {item['output_controls'].get('phase_sequence')}")
+            print(f"{item['name']} -> {status}", file=summary_buffer)
+            print(f"  input phases:  {item['input_controls'].get('phase_sequence')}", file=summary_buffer)
+            print(f"  output phases: {item['output_controls'].get('phase_sequence')}", file=summary_buffer)
             if item["expected_phases"] is not None:
-                print(f"  expected phases: {item['expected_phases']}")
+                print(f"  expected phases: {item['expected_phases']}", file=summary_buffer)
                 if not item["phase_match"]:
-                    print("  ⚠︎ Phase sequence mismatch")
+                    print("  ⚠︎ Phase sequence mismatch", file=summary_buffer)
             if item["expected_flags"]:
-                print(f"  expected flags: {item['expected_flags']}")
+                print(f"  expected flags: {item['expected_flags']}", file=summary_buffer)
                 actual_subset = {
                     key: item["output_controls"].get(key)
                     for key in item["expected_flags"]
                 }
-                print(f"  actual flags:   {actual_subset}")
+                print(f"  actual flags:   {actual_subset}", file=summary_buffer)
             if item["flag_mismatches"]:
-                print(f"  ⚠︎ Flag mismatches: {item['flag_mismatches']}")
+                print(f"  ⚠︎ Flag mismatches: {item['flag_mismatches']}", file=summary_buffer)
             if item["expected_top_k"] is not None:
-                print(f"  expected top_k_hint: {item['expected_top_k']}")
-                print(f"  actual top_k_hint:   {item['actual_top_k']}")
+                print(f"  expected top_k_hint: {item['expected_top_k']}", file=summary_buffer)
+                print(f"  actual top_k_hint:   {item['actual_top_k']}", file=summary_buffer)
                 if not item["top_k_match"]:
-                    print("  ⚠︎ top_k_hint mismatch")
+                    print("  ⚠︎ top_k_hint mismatch", file=summary_buffer)
+        sys.stdout.write(summary_buffer.getvalue())
 
 
 if __name__ == "__main__":
-    import sys
     num_scenarios = None
     if len(sys.argv) > 1:
         try:
@@ -1,4 +1,6 @@
 import logging
+import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from crewai import Agent, Crew, LLM, Process, Task
@@ -13,8 +15,38 @@ from resume_screening_rag_automation.knowledge import loader as knowledge_loader
 from resume_screening_rag_automation.tools.scenario_hint_tool import ScenarioHintTool
 
 logger = logging.getLogger(__name__)
-from dotenv import load_dotenv
-load_dotenv()
+
+# Verbose agent logging writes every step to stdout; keep it opt-in.
+CREW_VERBOSE = os.getenv("HIREX_CREW_VERBOSE", "0").strip().lower() in {"1", "true", "yes"}
+
+
+@lru_cache(maxsize=1)
+def _ensure_dotenv() -> None:
+    """Load ``.env`` once, on first crew construction rather than at import."""
+
+    if os.getenv("HIREX_LOAD_DOTENV", "1") == "1":
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def _query_manager_llm() -> LLM:
+    """Build the shared QueryManager LLM handle on first use."""
+
+    return LLM(model=QUERY_MANAGER_CREW_MODEL, temperature=QUERY_MANAGER_CREW_TEMPERATURE)
+
+
+@lru_cache(maxsize=1)
+def _scenario_hint_tool() -> ScenarioHintTool:
+    """Build the shared scenario hint tool on first use.
+
+    The tool is stateless (its index is cached at module level), so one
+    instance serves every crew alongside the LLM handle.
+    """
+
+    return ScenarioHintTool()
+
 
 @CrewBase
 class QueryManagerCrew:
@@ -23,7 +55,6 @@ class QueryManagerCrew:
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
     folder_name = "query_manager_crew"
-    llm = LLM(model=QUERY_MANAGER_CREW_MODEL, temperature=QUERY_MANAGER_CREW_TEMPERATURE)
 
     def __init__(
         self,
@@ -33,6 +64,7 @@ class QueryManagerCrew:
         **kwargs: Any,
     ) -> None:
 
+        _ensure_dotenv()
         self._session_id = session_id
         self._memory_kwargs = dict(memory_kwargs or {})
         self._memory_enabled = bool(self._memory_kwargs)
@@ -41,7 +73,10 @@ class QueryManagerCrew:
         except Exception as exc:  # pragma: no cover - knowledge optional during local smoke tests
             logger.warning("Falling back to no knowledge for QueryManager crew: %s", exc)
             self.knowledge = None
-        self._scenario_hint_tool = ScenarioHintTool()
+
+    @property
+    def llm(self) -> LLM:
+        return _query_manager_llm()
 
     @agent
     def query_routing_manager(self) -> Agent:
@@ -49,7 +84,7 @@ class QueryManagerCrew:
         return Agent(
             config=self.agents_config["query_routing_manager"],
             llm=self.llm,
-            tools=[self._scenario_hint_tool],
+            tools=[_scenario_hint_tool()],
             memory=self._memory_enabled,
             allow_delegation=False,
             max_iter=5,  # Increased for slower network latency on Render
@@ -71,8 +106,8 @@ class QueryManagerCrew:
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            planning=True,
-            verbose=True,
+            planning=False,  # single routing task already carries its own reasoning protocol
+            verbose=CREW_VERBOSE,
             memory=self._memory_enabled,
             knowledge=self.knowledge,
             cache=True,  # Enable caching for performance optimization
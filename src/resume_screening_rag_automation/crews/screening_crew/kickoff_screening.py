@@ -5,6 +5,11 @@ from __future__ import annotations
 import json
 from typing import Any
 
+try:  # pragma: no cover - orjson is an optional speed-up for the kickoff scripts.
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json.
+    orjson = None
+
 from resume_screening_rag_automation.core.py_models import JobDescription, JobType, ScreeningInput
 from resume_screening_rag_automation.crews.screening_crew.screening_crew import (
     ScreeningCrew,
@@ -12,6 +17,17 @@ from resume_screening_rag_automation.crews.screening_crew.screening_crew import
 from resume_screening_rag_automation.state import ChatSessionState
 
 
+def _dumps_indent2(obj: Any) -> str:
+    """Serialise ``obj`` as indented UTF-8 JSON, using orjson when available."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:  # pragma: no cover - fall back for types orjson rejects
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def _print_result(result: Any) -> None:
     payload = getattr(result, "pydantic", None)
     if payload is not None:
@@ -20,7 +36,7 @@ def _print_result(result: Any) -> None:
 
     json_dict = getattr(result, "json_dict", None)
     if json_dict is not None:
-        print(json.dumps(json_dict, indent=2, ensure_ascii=False))
+        print(_dumps_indent2(json_dict))
         return
 
     raw = getattr(result, "raw", None)
@@ -79,8 +95,6 @@ def main() -> None:
         ],
     )
 
-    chat_state = ChatSessionState(session_id=session_id, job_snapshot=job_snapshot)
-
     inputs = ScreeningInput(
         user_query="Screen the top automation engineers who match the Danish Senior Electrical and Automation Engineer brief.",
         job_snapshot=job_snapshot,
@@ -88,23 +102,29 @@ def main() -> None:
         session_id=session_id,
     )
 
-    chat_state.top_k = inputs.top_k
-    chat_state.scoring_weights = inputs.scoring_weights
-    chat_state.feature_weights = inputs.feature_weights
-
-    kickoff_inputs = inputs.model_dump(mode="json")
-    kickoff_inputs.update(
-        {
-            "job_snapshot": json.dumps(kickoff_inputs.get("job_snapshot", {}), indent=2, ensure_ascii=False),
-            "scoring_weights": json.dumps(kickoff_inputs.get("scoring_weights", {}), indent=2, ensure_ascii=False),
-            "feature_weights": json.dumps(kickoff_inputs.get("feature_weights", {}), indent=2, ensure_ascii=False),
-            "candidate_insights": "[]",
-            "retrieval_md": "",
-            "candidates": "[]",
-            "session_id": chat_state.session_id,
-        }
+    chat_state = ChatSessionState(
+        session_id=session_id,
+        job_snapshot=job_snapshot,
+        top_k=inputs.top_k,
+        scoring_weights=inputs.scoring_weights,
+        feature_weights=inputs.feature_weights,
     )
 
+    # Serialise nested models straight to JSON instead of dumping the whole
+    # input to a dict and re-encoding the nested parts.
+    kickoff_inputs = {
+        "user_query": inputs.user_query,
+        "top_k": inputs.top_k,
+        "phase": inputs.phase.value,
+        "job_snapshot": inputs.job_snapshot.model_dump_json(indent=2) if inputs.job_snapshot else "{}",
+        "scoring_weights": _dumps_indent2(inputs.scoring_weights),
+        "feature_weights": _dumps_indent2(inputs.feature_weights),
+        "candidate_insights": "[]",
+        "retrieval_md": "",
+        "candidates": "[]",
+        "session_id": chat_state.session_id,
+    }
+
     result = crew.kickoff(inputs=kickoff_inputs)
 
     _print_result(result)
@@ -1,6 +1,22 @@
 import json
 import logging
-from typing import Any, Dict, Iterable, Optional
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+try:  # pragma: no cover - orjson is an optional, faster JSON backend.
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json.
+    orjson = None
+
+try:  # pragma: no cover - xxhash is an optional, faster digest for callback dedupe.
+    import xxhash
+except ImportError:  # pragma: no cover - fall back to the builtin string hash.
+    xxhash = None
+
+try:  # pragma: no cover - msgspec is a second optional decoder.
+    import msgspec
+except ImportError:  # pragma: no cover - fall back to stdlib json.
+    msgspec = None
 
 from crewai import Agent, Task, Crew, Process, LLM
 from crewai.project import CrewBase, agent, task, crew, before_kickoff
@@ -26,6 +42,38 @@ load_dotenv()
 
 LOGGER = logging.getLogger(__name__)
 
+# Prefer the fastest available decoder. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError; msgspec raises its own DecodeError, so callers catch
+# the _JSON_DECODE_ERRORS tuple.
+if orjson is not None:
+    _json_loads = orjson.loads
+elif msgspec is not None:
+    _json_loads = msgspec.json.decode
+else:
+    _json_loads = json.loads
+_JSON_DECODE_ERRORS: Tuple[type, ...] = (json.JSONDecodeError,)
+if msgspec is not None:
+    _JSON_DECODE_ERRORS += (msgspec.DecodeError,)
+
+
+def _raw_digest(output: Optional[TaskOutput]) -> Optional[int]:
+    """Digest ``output.raw`` so callbacks can skip re-processing identical outputs."""
+
+    raw = getattr(output, "raw", None)
+    if not isinstance(raw, str) or not raw:
+        return None
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(raw.encode("utf-8"))
+    return hash(raw)
+
+
+@lru_cache(maxsize=256)
+def _parse_json_cached(raw: str) -> Any:
+    """Parse ``raw`` once per distinct string; callers must not mutate the result."""
+
+    return _json_loads(raw)
+
+
 @CrewBase
 class ScreeningCrew:
     """Crew for screening and matching candidates."""
@@ -47,16 +95,30 @@ class ScreeningCrew:
         self._memory_kwargs = dict(memory_kwargs or {})
         self._memory_enabled = bool(self._memory_kwargs)
         self._interpolation_inputs: Dict[str, Any] = {}
+        self._tasks_by_name: Dict[str, Task] = {}
+        self._last_retrieval_digest: Optional[int] = None
+        self._last_analysis_digest: Optional[int] = None
         try:
             self.knowledge = knowledge_loader.for_screening(session_id=session_id)
         except Exception as exc:  # pragma: no cover - allow local testing without vector DB
             LOGGER.warning("Falling back to no knowledge for Screening crew: %s", exc)
             self.knowledge = None
-        self._retrieval_tool = ExtractCandidatesTool()
-        self._candidate_profile_tool = CandidateProfileTool()
-        self._candidate_evidence_tool = CandidateEvidenceTool()
-        self._search_resumes_tool = SearchResumesTool()
 
+    @cached_property
+    def _retrieval_tool(self) -> ExtractCandidatesTool:
+        return ExtractCandidatesTool()
+
+    @cached_property
+    def _candidate_profile_tool(self) -> CandidateProfileTool:
+        return CandidateProfileTool()
+
+    @cached_property
+    def _candidate_evidence_tool(self) -> CandidateEvidenceTool:
+        return CandidateEvidenceTool()
+
+    @cached_property
+    def _search_resumes_tool(self) -> SearchResumesTool:
+        return SearchResumesTool()
 
     @agent
     def retriever(self) -> Agent:
@@ -136,6 +198,7 @@ class ScreeningCrew:
             tasks[1].context = [tasks[0]]
         if len(tasks) >= 3:
             tasks[2].context = [tasks[0], tasks[1]]
+        self._tasks_by_name = {task_obj.name: task_obj for task_obj in tasks}
 
         return Crew(
             agents=agents,
@@ -154,9 +217,17 @@ class ScreeningCrew:
         """Persist the latest interpolation inputs so callbacks can refresh task prompts."""
         base: Dict[str, Any] = dict(inputs or {})
         self._interpolation_inputs = base
+        # A new kickoff has new inputs, so an identical output is no longer a repeat.
+        self._last_retrieval_digest = None
+        self._last_analysis_digest = None
         return base
 
     def _propagate_retrieval_results(self, output: TaskOutput) -> None:
+        digest = _raw_digest(output)
+        if digest is not None and digest == self._last_retrieval_digest:
+            return
+        self._last_retrieval_digest = digest
+
         payload = self._extract_payload(output)
         if not payload:
             payload = {}
@@ -190,9 +261,14 @@ class ScreeningCrew:
             updates["feature_weights"] = feature_weights
 
         if updates:
-            self._update_task_inputs(["analyse_candidates", "present_screening_results"], updates)
+            self._update_task_inputs(("analyse_candidates", "present_screening_results"), updates)
 
     def _propagate_analysis_results(self, output: TaskOutput) -> None:
+        digest = _raw_digest(output)
+        if digest is not None and digest == self._last_analysis_digest:
+            return
+        self._last_analysis_digest = digest
+
         payload = self._extract_payload(output)
         if not payload:
             return
@@ -201,7 +277,7 @@ class ScreeningCrew:
         if insights is None:
             return
 
-        self._update_task_inputs(["present_screening_results"], {"candidate_insights": insights})
+        self._update_task_inputs(("present_screening_results",), {"candidate_insights": insights})
 
     def _extract_payload(self, output: TaskOutput) -> Dict[str, Any]:
         if output is None:
@@ -213,12 +289,14 @@ class ScreeningCrew:
         raw = output.raw
         if isinstance(raw, str):
             try:
-                return json.loads(raw)
-            except json.JSONDecodeError:
+                parsed = _parse_json_cached(raw)
+            except _JSON_DECODE_ERRORS:
                 return {}
+            # Callbacks update the payload in place; keep the cached copy intact.
+            return dict(parsed) if isinstance(parsed, dict) else parsed
         return {}
 
-    def _update_task_inputs(self, task_names: Iterable[str], updates: Dict[str, Any]) -> None:
+    def _update_task_inputs(self, task_names: Tuple[str, ...], updates: Dict[str, Any]) -> None:
         if not updates:
             return
         if not self._interpolation_inputs:
@@ -227,16 +305,23 @@ class ScreeningCrew:
         for key, value in updates.items():
             self._interpolation_inputs[key] = self._stringify(value)
 
-        for task in self.tasks:
-            if task.name in task_names:
-                try:
-                    task.interpolate_inputs_and_add_conversation_history(self._interpolation_inputs)
-                except ValueError as exc:
-                    LOGGER.debug("Interpolation refresh failed for task %s: %s", task.name, exc)
+        for name in task_names:
+            task_obj = self._tasks_by_name.get(name)
+            if task_obj is None:
+                continue
+            try:
+                task_obj.interpolate_inputs_and_add_conversation_history(self._interpolation_inputs)
+            except ValueError as exc:
+                LOGGER.debug("Interpolation refresh failed for task %s: %s", name, exc)
 
     @staticmethod
     def _stringify(value: Any) -> Any:
         if isinstance(value, (dict, list)):
+            if orjson is not None:
+                try:
+                    return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+                except TypeError:  # pragma: no cover - fall back for types orjson rejects
+                    pass
             return json.dumps(value, indent=2, ensure_ascii=False)
         return value
 
@@ -283,8 +368,8 @@ class ScreeningCrew:
     def _coerce_json(self, value: Any) -> Any:
         if isinstance(value, str):
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return _parse_json_cached(value)
+            except _JSON_DECODE_ERRORS:
                 return value
         return value
 
@@ -296,8 +381,12 @@ class ScreeningCrew:
             return
 
         output.pydantic = refreshed
-        output.json_dict = refreshed.model_dump()
         try:
             output.raw = refreshed.model_dump_json()
         except Exception:  # pragma: no cover - raw serialisation optional
             output.raw = None
+            output.json_dict = refreshed.model_dump()
+            return
+        # Derive the dict view from the JSON we already produced instead of a
+        # second model traversal.
+        output.json_dict = _json_loads(output.raw)
@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # pragma: no cover - orjson is an optional, faster JSON backend.
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json.
+    orjson = None
 
 from resume_screening_rag_automation.core.py_models import CandidateScreeningOutput
 from resume_screening_rag_automation.paths import (
@@ -17,6 +27,13 @@ from resume_screening_rag_automation.storage_sync import knowledge_store_sync
 
 LOGGER = logging.getLogger(__name__)
 
+# session_id -> (file signature after our last write, payload written). Lets
+# repeated appends skip re-reading and re-parsing the session file unless
+# something else has modified it since. Bounded LRU over recent sessions.
+_PAYLOAD_CACHE_SIZE = 64
+_PAYLOAD_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+_PAYLOAD_CACHE_LOCK = threading.Lock()
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -27,17 +44,65 @@ def _insight_path_for_session(session_id: str) -> Path:
     return SCREENING_INSIGHTS_DIR / f"{session_id}.json"
 
 
-def _record_identifier(job_title: Optional[str], timestamp: str) -> str:
+@lru_cache(maxsize=1024)
+def _safe_job_title_base(job_title: Optional[str]) -> str:
     base = (job_title or "untitled").strip().lower() or "untitled"
-    safe_base = "_".join(base.split())
-    return f"{safe_base}:{timestamp}"
+    return "_".join(base.split())
+
+
+def _record_identifier(job_title: Optional[str], timestamp: str) -> str:
+    return f"{_safe_job_title_base(job_title)}:{timestamp}"
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cached_payload(session_id: str, path: Path) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached payload if the file is still as we wrote it."""
+
+    with _PAYLOAD_CACHE_LOCK:
+        cached = _PAYLOAD_CACHE.get(session_id)
+        if cached is None:
+            return None
+        if cached[0] != _file_signature(path):
+            del _PAYLOAD_CACHE[session_id]
+            return None
+        _PAYLOAD_CACHE.move_to_end(session_id)
+        payload = cached[1]
+    # Appends mutate the payload; keep the cached one intact until the write lands.
+    copied = dict(payload)
+    copied["records"] = list(payload["records"])
+    return copied
+
+
+def _remember_payload(session_id: str, path: Path, payload: Dict[str, Any]) -> None:
+    signature = _file_signature(path)
+    with _PAYLOAD_CACHE_LOCK:
+        if signature is None:
+            _PAYLOAD_CACHE.pop(session_id, None)
+            return
+        _PAYLOAD_CACHE[session_id] = (signature, payload)
+        _PAYLOAD_CACHE.move_to_end(session_id)
+        while len(_PAYLOAD_CACHE) > _PAYLOAD_CACHE_SIZE:
+            _PAYLOAD_CACHE.popitem(last=False)
 
 
 def _load_records(path: Path, *, session_id: str) -> Dict[str, Any]:
     if not path.exists():
         return {"session_id": session_id, "records": []}
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        if orjson is not None:
+            # Parse straight from the mapped pages instead of copying the file into memory first.
+            with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    payload = orjson.loads(view)
+        else:
+            payload = json.loads(path.read_text(encoding="utf-8"))
     except Exception:  # pragma: no cover - defensive fallback
         LOGGER.warning("Failed to read screening insights for session=%s; recreating", session_id, exc_info=True)
         return {"session_id": session_id, "records": []}
@@ -59,10 +124,21 @@ def _load_records(path: Path, *, session_id: str) -> Dict[str, Any]:
 
 def _write_records(path: Path, payload: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        buffer = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        buffer = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+    # Write the encoded bytes straight to the descriptor, skipping the text layer.
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(buffer)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def append_screening_insights(
@@ -82,8 +158,10 @@ def append_screening_insights(
         return
 
     path = _insight_path_for_session(session_id)
-    payload = _load_records(path, session_id=session_id)
-    entries: List[Dict[str, Any]] = list(payload.get("records") or [])
+    payload = _cached_payload(session_id, path)
+    if payload is None:
+        payload = _load_records(path, session_id=session_id)
+    entries: List[Dict[str, Any]] = payload["records"]
 
     timestamp = _utc_now()
 
@@ -101,20 +179,25 @@ def append_screening_insights(
     }
     entries.append(entry)
 
-    payload["session_id"] = session_id
-    payload["records"] = entries
-    payload["job_titles"] = sorted(
-        {
+    if isinstance(payload.get("job_titles"), list):
+        job_titles = set(payload["job_titles"])
+        if job_title and job_title.strip():
+            job_titles.add(job_title.strip())
+    else:
+        job_titles = {
             (item.get("job_title") or "").strip()
             for item in entries
             if item.get("job_title")
         }
-    )
-    payload["last_updated"] = _utc_now()
+
+    payload["session_id"] = session_id
+    payload["job_titles"] = sorted(job_titles)
+    payload["last_updated"] = timestamp
 
     _write_records(path, payload)
+    _remember_payload(session_id, path, payload)
     knowledge_store_sync.mark_dirty()
-    knowledge_store_sync.flush_if_needed()
+    knowledge_store_sync.flush_in_background()
     LOGGER.info(
         "Persisted %s candidate insights to knowledge for session=%s",
         len(output.candidate_insights),
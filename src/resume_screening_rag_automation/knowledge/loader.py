@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import yaml
 from crewai.knowledge.knowledge import Knowledge
@@ -24,10 +26,22 @@ from resume_screening_rag_automation.paths import (
 )
 from resume_screening_rag_automation.tools.vectorstore_utils import DEFAULT_EMBEDDING_MODEL
 
+try:  # pragma: no cover - libyaml bindings are optional.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - fall back to the pure-Python loader.
+    from yaml import SafeLoader as _YamlLoader
+
 LOGGER = logging.getLogger(__name__)
 
 _PACKAGE_ROOT = Path(__file__).resolve().parent.parent
 _CONFIG_PATH = Path(__file__).resolve().parent / "sources.yaml"
+_LEGACY_VECTOR_TOKENS = frozenset({"chroma_vectorstore", "knowledge/chroma_vectorstore"})
+_LEGACY_VECTOR_PATHS = frozenset(
+    {
+        (_PACKAGE_ROOT / "chroma_vectorstore").resolve(),
+        (_PACKAGE_ROOT / "knowledge" / "chroma_vectorstore").resolve(),
+    }
+)
 
 _DOCUMENT_FACTORIES: Dict[str, Any] = {
     "json": JSONKnowledgeSource,
@@ -60,7 +74,7 @@ def _raw_config() -> Dict[str, Any]:
 
     try:
         with _CONFIG_PATH.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle) or {}
+            data = yaml.load(handle, Loader=_YamlLoader) or {}
     except yaml.YAMLError as exc:  # pragma: no cover - invalid YAML is unlikely in tests
         raise KnowledgeConfigError("Invalid knowledge configuration YAML") from exc
 
@@ -85,6 +99,7 @@ def _resolve_path(path_value: str) -> Path:
     return path
 
 
+@lru_cache(maxsize=None)
 def _resolve_vector_directory(path_value: str) -> Path:
     """Resolve a vector store directory, aligning legacy paths with the new layout."""
 
@@ -92,8 +107,7 @@ def _resolve_vector_directory(path_value: str) -> Path:
         return CHROMA_VECTOR_DIR.resolve()
 
     normalised = path_value.replace("\\", "/").strip()
-    legacy_tokens = {"chroma_vectorstore", "knowledge/chroma_vectorstore"}
-    if normalised in legacy_tokens:
+    if normalised in _LEGACY_VECTOR_TOKENS:
         return CHROMA_VECTOR_DIR.resolve()
 
     if normalised.startswith("knowledge_store/"):
@@ -101,11 +115,7 @@ def _resolve_vector_directory(path_value: str) -> Path:
         return (DATA_ROOT / remainder).resolve()
 
     candidate = _resolve_path(normalised)
-    legacy_paths = {
-        (_PACKAGE_ROOT / "chroma_vectorstore").resolve(),
-        (_PACKAGE_ROOT / "knowledge" / "chroma_vectorstore").resolve(),
-    }
-    if candidate in legacy_paths:
+    if candidate in _LEGACY_VECTOR_PATHS:
         return CHROMA_VECTOR_DIR.resolve()
 
     return candidate.resolve()
@@ -186,50 +196,89 @@ def _build_vector_source(
     return VectorStoreKnowledgeSource(**model_kwargs)
 
 
+@dataclass(frozen=True, slots=True)
+class _GroupSpec:
+    """Session-independent configuration resolved for a knowledge group."""
+
+    collection_name: str
+    persist_directory: Path
+    vector_sources: Tuple[Tuple[str, Mapping[str, Any]], ...]
+    document_sources: Tuple[Tuple[str, Mapping[str, Any]], ...]
+
+
+def _referenced_sources(
+    kind: str,
+    names: Optional[List[str]],
+    definitions: Mapping[str, Mapping[str, Any]],
+) -> Tuple[Tuple[str, Mapping[str, Any]], ...]:
+    resolved: List[Tuple[str, Mapping[str, Any]]] = []
+    for name in names or []:
+        config = definitions.get(name)
+        if not config:
+            LOGGER.warning("%s source '%s' referenced but not defined", kind, name)
+            continue
+        resolved.append((name, MappingProxyType(dict(config))))
+    return tuple(resolved)
+
+
+@lru_cache(maxsize=8)
+def _group_spec(group_name: str) -> _GroupSpec:
+    """Validate and resolve the configuration for ``group_name`` once."""
+
+    config = _raw_config()
+    group_config = config.get("groups", {}).get(group_name)
+    if not group_config:
+        raise KnowledgeConfigError(f"Knowledge group '{group_name}' not configured")
+
+    if "collection_name" not in group_config:
+        raise KnowledgeConfigError(f"Knowledge group '{group_name}' requires a collection_name")
+
+    defaults = config.get("defaults", {})
+    persist_directory_value = str(
+        group_config.get("persist_directory")
+        or defaults.get("persist_directory", str(CHROMA_VECTOR_DIR))
+    )
+
+    return _GroupSpec(
+        collection_name=str(group_config["collection_name"]),
+        persist_directory=_resolve_vector_directory(persist_directory_value),
+        vector_sources=_referenced_sources(
+            "Vector",
+            group_config.get("vector_sources"),
+            config.get("vector_sources", {}) or {},
+        ),
+        document_sources=_referenced_sources(
+            "Document",
+            group_config.get("document_sources"),
+            config.get("document_sources", {}) or {},
+        ),
+    )
+
+
 def _collect_sources(
     group_name: str,
-    group_config: Mapping[str, Any],
+    spec: _GroupSpec,
     *,
-    defaults: Mapping[str, Any],
-    vector_sources: Mapping[str, Mapping[str, Any]],
-    document_sources: Mapping[str, Mapping[str, Any]],
     session_id: Optional[str],
 ) -> List[BaseKnowledgeSource]:
     """Build all sources for the requested knowledge group."""
 
     sources: List[BaseKnowledgeSource] = []
 
-    default_directory_value = str(
-        group_config.get("persist_directory")
-        or defaults.get("persist_directory", str(CHROMA_VECTOR_DIR))
-    )
-    default_directory = _resolve_vector_directory(default_directory_value)
-
-    collection_name = str(group_config.get("collection_name"))
-
-    for vector_name in group_config.get("vector_sources", []) or []:
-        vector_config = vector_sources.get(vector_name)
-        if not vector_config:
-            LOGGER.warning("Vector source '%s' referenced but not defined", vector_name)
-            continue
+    for vector_name, vector_config in spec.vector_sources:
         try:
             sources.append(
                 _build_vector_source(
                     vector_name,
                     vector_config,
-                    default_directory=default_directory,
-                    collection_name=collection_name,
+                    default_directory=spec.persist_directory,
+                    collection_name=spec.collection_name,
                 )
             )
         except FileNotFoundError:
             continue
 
-    for document_name in group_config.get("document_sources", []) or []:
-        document_config = document_sources.get(document_name)
-        if not document_config:
-            LOGGER.warning("Document source '%s' referenced but not defined", document_name)
-            continue
-
+    for document_name, document_config in spec.document_sources:
         override_path: Optional[Path] = None
         if document_name == "generated_screening_insights":
             if not session_id:
@@ -247,7 +296,7 @@ def _collect_sources(
                 _build_document_source(
                     document_name,
                     document_config,
-                    collection_name=collection_name,
+                    collection_name=spec.collection_name,
                     override_path=override_path,
                 )
             )
@@ -268,24 +317,9 @@ def _collect_sources(
 def _build_group_knowledge(group_name: str, *, session_id: Optional[str] = None) -> Knowledge:
     """Create a Knowledge instance for the requested group key."""
 
-    config = _raw_config()
-    group_config = config.get("groups", {}).get(group_name)
-    if not group_config:
-        raise KnowledgeConfigError(f"Knowledge group '{group_name}' not configured")
-
-    if "collection_name" not in group_config:
-        raise KnowledgeConfigError(f"Knowledge group '{group_name}' requires a collection_name")
-
-    defaults = config.get("defaults", {})
-    vector_sources = config.get("vector_sources", {}) or {}
-    document_sources = config.get("document_sources", {}) or {}
-
-    collection_name = str(group_config["collection_name"])
-    persist_directory_value = str(
-        group_config.get("persist_directory")
-        or defaults.get("persist_directory", str(CHROMA_VECTOR_DIR))
-    )
-    persist_directory = _resolve_vector_directory(persist_directory_value)
+    spec = _group_spec(group_name)
+    collection_name = spec.collection_name
+    persist_directory = spec.persist_directory
 
     ensure_data_directories()
 
@@ -296,14 +330,7 @@ def _build_group_knowledge(group_name: str, *, session_id: Optional[str] = None)
         session_id=session_id,
     )
 
-    sources = _collect_sources(
-        group_name,
-        group_config,
-        defaults=defaults,
-        vector_sources=vector_sources,
-        document_sources=document_sources,
-        session_id=session_id,
-    )
+    sources = _collect_sources(group_name, spec, session_id=session_id)
 
     return Knowledge(
         collection_name=collection_name,
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
-from pathlib import Path
-from typing import Optional
+import sqlite3
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 from crewai.rag.chromadb.client import ChromaDBClient
 
+try:  # pragma: no cover - chromadb optional in some environments
+    from chromadb.api.types import EmbeddingFunction as _EmbeddingFunctionBase
+except Exception:  # pragma: no cover - keep the wrapper importable without chromadb
+    _EmbeddingFunctionBase = object  # type: ignore[assignment,misc]
+
+from resume_screening_rag_automation.paths import EMBEDDING_CACHE_DIR
 from resume_screening_rag_automation.tools.vectorstore_utils import (
     DEFAULT_EMBEDDING_MODEL,
     ensure_chroma_client,
@@ -18,20 +30,244 @@ from resume_screening_rag_automation.tools.vectorstore_utils import (
 
 LOGGER = logging.getLogger(__name__)
 
+# Documents written to Chroma per add call; keeps embedding requests bounded.
+_BATCH_SIZE = 200
+
+# Byte table folding A-Z to a-z and mapping every other non-[a-z0-9] byte to
+# "-". Text is first encoded to ASCII with "?" replacements, so non-ASCII code
+# points become dashes too.
+_DASH_TABLE = bytes(
+    byte + 0x20 if 0x41 <= byte <= 0x5A
+    else byte if (0x30 <= byte <= 0x39 or 0x61 <= byte <= 0x7A)
+    else 0x2D
+    for byte in range(256)
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+# ChromaDBClient wrappers shared by every storage of an embedding model.
+_SHARED_CLIENTS: Dict[str, ChromaDBClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+# Persist directories already created in this process.
+_CREATED_DIRS: Set[str] = set()
+_CREATED_DIRS_LOCK = threading.Lock()
+
+
+def _dashify(text: str) -> str:
+    """Lower-case ``text`` and replace each run of non-alphanumerics with one dash."""
+
+    translated = text.encode("ascii", "replace").translate(_DASH_TABLE).decode("ascii")
+    if "--" in translated:
+        translated = _DASH_RUN_RE.sub("-", translated)
+    return translated
+
+
+@lru_cache(maxsize=64)
+def _resolve_dir(path: str) -> str:
+    """Return the absolute, user-expanded form of ``path`` (memoised per process).
+
+    Plain paths are normalised lexically; only symlinks pay for ``realpath``.
+    """
+
+    resolved = os.path.abspath(os.path.expanduser(path))
+    if os.path.islink(resolved):
+        resolved = os.path.realpath(resolved)
+    return resolved
+
+
+class _CachedEmbeddingFunction(_EmbeddingFunctionBase):
+    """Serve embeddings from an on-disk cache keyed by a hash of the input text.
+
+    Only texts missing from the cache are sent to the wrapped embedder, in a
+    single batch; results are stored in a per-model SQLite file as float16
+    (half the bytes of float32, ample precision for cosine similarity) and
+    widened back to float32 on read. Fresh embeddings are rounded the same way,
+    so a text always gets the same vector whether or not it was cached.
+
+    Implements chroma's ``EmbeddingFunction`` protocol explicitly; identity and
+    configuration (``name``, ``get_config`` ...) are those of the wrapped
+    embedder so persisted collection configs stay unchanged.
+    """
+
+    def __init__(self, inner: Any, model_name: str) -> None:
+        self._inner = inner
+        self._model_name = model_name
+        self._path = EMBEDDING_CACHE_DIR / f"{_dashify(model_name)}.sqlite3"
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __call__(self, input: Any) -> Any:  # noqa: ANN401 - signature expected by chromadb
+        texts = [input] if isinstance(input, str) else list(input)
+        if not texts or not all(isinstance(text, str) for text in texts):
+            return self._inner(input)
+
+        keys = [self._key(text) for text in texts]
+        try:
+            cached = self._get_many(keys)
+        except sqlite3.Error:  # pragma: no cover - cache is best effort
+            LOGGER.debug("Embedding cache read failed; embedding directly", exc_info=True)
+            return self._inner(input)
+
+        missing = [index for index, key in enumerate(keys) if key not in cached]
+        if missing:
+            # Identical texts in one call share a key; embed each only once.
+            pending: Dict[str, str] = {}
+            for index in missing:
+                pending.setdefault(keys[index], texts[index])
+            computed = self._inner(list(pending.values()))
+            fresh = {
+                key: np.asarray(vector, dtype=np.float16).astype(np.float32)
+                for key, vector in zip(pending, computed)
+            }
+            try:
+                self._put_many(fresh)
+            except sqlite3.Error:  # pragma: no cover - cache is best effort
+                LOGGER.debug("Embedding cache write failed", exc_info=True)
+            cached.update(fresh)
+        return [cached[key] for key in keys]
+
+    def embed_query(self, input: Any) -> Any:  # noqa: ANN401 - signature expected by chromadb
+        target = getattr(self._inner, "embed_query", None)
+        if target is not None:
+            return target(input)
+        return self(input)
+
+    def name(self) -> str:  # type: ignore[override]
+        target = getattr(self._inner, "name", None)
+        if target is None:
+            # chroma treats a missing name as a legacy embedding function.
+            raise NotImplementedError("wrapped embedder does not define name()")
+        return target()
+
+    def is_legacy(self) -> bool:
+        target = getattr(self._inner, "is_legacy", None)
+        return bool(target()) if target is not None else True
+
+    def get_config(self) -> Dict[str, Any]:
+        target = getattr(self._inner, "get_config", None)
+        if target is None:
+            raise NotImplementedError("wrapped embedder does not define get_config()")
+        return target()
+
+    def default_space(self) -> Any:
+        target = getattr(self._inner, "default_space", None)
+        return target() if target is not None else _EmbeddingFunctionBase.default_space(self)
+
+    def supported_spaces(self) -> Any:
+        target = getattr(self._inner, "supported_spaces", None)
+        return target() if target is not None else _EmbeddingFunctionBase.supported_spaces(self)
+
+    def __getattr__(self, item: str) -> Any:
+        # Only reached for attributes missing here. Refuse ``_inner`` itself (not
+        # yet set during copy/unpickle) and dunders so protocol lookups never
+        # recurse or silently pick up the wrapped embedder's implementation.
+        if item == "_inner" or (item.startswith("__") and item.endswith("__")):
+            raise AttributeError(item)
+        return getattr(self._inner, item)
+
+    def _key(self, text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_f16 (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        with self._lock:
+            conn = self._connection()
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings_f16 WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+        return found
+
+    def _put_many(self, vectors: Dict[str, Any]) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings_f16 (key, vector) VALUES (?, ?)",
+                    [(key, vector.astype(np.float16).tobytes()) for key, vector in vectors.items()],
+                )
+
+
+def _ensure_directory(path: str) -> None:
+    """Create ``path`` at most once per process."""
+
+    if path in _CREATED_DIRS:
+        return
+    with _CREATED_DIRS_LOCK:
+        if path not in _CREATED_DIRS:
+            os.makedirs(path, exist_ok=True)
+            _CREATED_DIRS.add(path)
+
+
+def _get_shared_client(model_name: str) -> ChromaDBClient:
+    """Return the ChromaDBClient wrapper shared by every storage using ``model_name``.
+
+    ``ensure_chroma_client`` already returns a process-wide client, so the only
+    per-storage difference was the embedding function; key on that alone. The
+    lock makes concurrent first calls build a single wrapper (and cache handle).
+    """
+
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(model_name)
+        if client is None:
+            client = ChromaDBClient(
+                client=ensure_chroma_client(),
+                embedding_function=_CachedEmbeddingFunction(get_embedding_function(model_name), model_name),
+            )
+            _SHARED_CLIENTS[model_name] = client
+        return client
+
 
 def _extract_model_name(embedder: Optional[object]) -> str:
     """Resolve the embedding model name from the provided embedder spec."""
 
-    if isinstance(embedder, dict):
-        config = embedder.get("config") if isinstance(embedder.get("config"), dict) else {}
-        model_name = config.get("model_name") or embedder.get("model_name")
-        if isinstance(model_name, str) and model_name.strip():
-            return model_name.strip()
+    if not isinstance(embedder, dict):
+        return DEFAULT_EMBEDDING_MODEL
+    config = embedder.get("config")
+    if not isinstance(config, dict):
+        config = {}
+    model_name = config.get("model_name") or embedder.get("model_name")
+    if isinstance(model_name, str):
+        model_name = model_name.strip()
+        if model_name:
+            return model_name
     return DEFAULT_EMBEDDING_MODEL
 
 
+@lru_cache(maxsize=256)
+def _collection_names(collection_name: Optional[str], session_id: Optional[str]) -> Tuple[str, str]:
+    """Return the normalised session component and full collection name."""
+
+    session_component = ChromaDirectoryKnowledgeStorage._normalise_session_id(session_id)
+    base_name = ChromaDirectoryKnowledgeStorage._normalise_collection_name(collection_name or "knowledge")
+    if session_component:
+        return session_component, sys.intern(f"session-{session_component}__{base_name}")
+    return session_component, sys.intern(base_name)
+
+
 class ChromaDirectoryKnowledgeStorage(KnowledgeStorage):
-    """Knowledge storage that reuses the project Chroma vector store."""
+    """Knowledge storage that reuses the project Chroma vector store.
+
+    The backing collection is opened lazily on the first ``search``/``save`` so
+    storages that are constructed but never queried cost no Chroma I/O.
+    """
 
     def __init__(
         self,
@@ -41,29 +277,77 @@ class ChromaDirectoryKnowledgeStorage(KnowledgeStorage):
         collection_name: Optional[str] = None,
         session_id: Optional[str] = None,
     ) -> None:
-        self.persist_directory = str(Path(persist_directory).expanduser().resolve())
-        self._model_name = _extract_model_name(embedder)
-        self._session_component = self._normalise_session_id(session_id)
+        self.persist_directory = _resolve_dir(persist_directory)
+        self._model_name = sys.intern(_extract_model_name(embedder))
+        # Reuse the shared Chroma client that uses the same embeddings as the resume
+        # store; it is looked up on first use so construction stays cheap.
+        self._resolved_client: Optional[ChromaDBClient] = None
         super().__init__(embedder=None, collection_name=collection_name)
 
-        # Build a shared Chroma client that uses the same embeddings as the resume store.
-        embedding_function = get_embedding_function(self._model_name)
-        self._client = ChromaDBClient(
-            client=ensure_chroma_client(),
-            embedding_function=embedding_function,
+        self._session_component, self._full_collection_name = _collection_names(
+            self.collection_name,
+            session_id,
         )
-        base_name = self.collection_name or "knowledge"
-        base_name = self._normalise_collection_name(base_name)
-        if self._session_component:
-            self._full_collection_name = f"session-{self._session_component}__{base_name}"
-        else:
-            self._full_collection_name = base_name
+        self._collection_ready = False
+        # Set once this storage has deleted its collection and not touched it since.
+        self._collection_dropped = False
+
+    @property
+    def _client(self) -> ChromaDBClient:
+        if self._resolved_client is None:
+            self._resolved_client = _get_shared_client(self._model_name)
+        return self._resolved_client
+
+    @_client.setter
+    def _client(self, value: Optional[ChromaDBClient]) -> None:
+        # KnowledgeStorage.__init__ assigns None; keep the pending shared client.
+        if value is not None:
+            self._resolved_client = value
 
     def initialize_knowledge_storage(self) -> None:
-        """Connect to or create the configured Chroma collection."""
+        """Defer collection setup until the storage is first read or written."""
+
+        self._collection_ready = False
 
-        persist_path = Path(self.persist_directory)
-        persist_path.mkdir(parents=True, exist_ok=True)
+    def search(self, *args: Any, **kwargs: Any) -> Any:
+        self._ensure_collection()
+        return super().search(*args, **kwargs)
+
+    def save(self, documents: List[str], *args: Any, **kwargs: Any) -> None:
+        """Write ``documents`` in bulk slices of ``_BATCH_SIZE``.
+
+        Only the ``metadata`` argument is understood: a per-document list is
+        sliced with the documents, a dict or None is passed to every slice. Any
+        other call shape is forwarded in one piece.
+        """
+
+        self._ensure_collection()
+        documents = list(documents)
+        metadata = args[0] if args else kwargs.get("metadata")
+        if (
+            len(documents) <= _BATCH_SIZE
+            or len(args) > 1
+            or any(key != "metadata" for key in kwargs)
+            or not (metadata is None or isinstance(metadata, (dict, list)))
+        ):
+            super().save(documents, *args, **kwargs)
+            return
+        for start in range(0, len(documents), _BATCH_SIZE):
+            end = start + _BATCH_SIZE
+            batch_metadata = metadata[start:end] if isinstance(metadata, list) else metadata
+            if args:
+                super().save(documents[start:end], batch_metadata)
+            elif kwargs:
+                super().save(documents[start:end], metadata=batch_metadata)
+            else:
+                super().save(documents[start:end])
+
+    def _ensure_collection(self) -> None:
+        """Connect to or create the configured Chroma collection once."""
+
+        if self._collection_ready:
+            return
+        _ensure_directory(self.persist_directory)
         try:
             self._client.get_or_create_collection(
                 collection_name=self._full_collection_name,
@@ -72,19 +356,25 @@ class ChromaDirectoryKnowledgeStorage(KnowledgeStorage):
             LOGGER.exception(
                 "Failed to initialise knowledge collection '%s' at %s",
                 self._full_collection_name,
-                persist_path,
+                self.persist_directory,
             )
             raise RuntimeError(
                 f"Failed to initialise knowledge collection '{self._full_collection_name}'"
             ) from exc
+        self._collection_ready = True
+        self._collection_dropped = False
 
     def reset(self) -> None:
         """Drop the knowledge collection while retaining the shared vector store."""
 
+        if self._collection_dropped:
+            return
+        self._collection_ready = False
         try:
             self._client.delete_collection(
                 collection_name=self._full_collection_name,
             )
+            self._collection_dropped = True
         except Exception as exc:  # pragma: no cover - defensive logging only
             LOGGER.debug(
                 "Knowledge collection '%s' could not be deleted cleanly: %s",
@@ -96,15 +386,11 @@ class ChromaDirectoryKnowledgeStorage(KnowledgeStorage):
     def _normalise_session_id(session_id: Optional[str]) -> str:
         if not session_id:
             return ""
-        cleaned = re.sub(r"[^a-zA-Z0-9]+", "-", session_id).strip("-")
-        return cleaned.lower()
+        return _dashify(session_id).strip("-")
 
     @staticmethod
     def _normalise_collection_name(name: str) -> str:
-        cleaned = re.sub(r"[^a-zA-Z0-9]+", "-", name).strip("-")
-        if not cleaned:
-            return "knowledge"
-        lowered = cleaned.lower()
-        if lowered == "knowledge":
+        cleaned = _dashify(name).strip("-")
+        if not cleaned or cleaned == "knowledge":
             return "knowledge"
-        return f"knowledge-{lowered}"
+        return f"knowledge-{cleaned}"
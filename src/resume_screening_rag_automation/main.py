@@ -4,8 +4,17 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:  # pragma: no cover - orjson is an optional speed-up for prompt serialisation.
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json.
+    orjson = None
 
 from crewai.flow.flow import Flow, and_, listen, or_, start
 from crewai.tasks.task_output import TaskOutput
@@ -37,7 +46,6 @@ from resume_screening_rag_automation.models import (
     DiscussionOutput,
     JobDescriptionInput,
     JobDescriptionOutput,
-    Metadata,
     QueryControls,
     QueryRoutingOutput,
     ScreeningInput,
@@ -52,6 +60,34 @@ from resume_screening_rag_automation.session_memory import SessionMemoryBundle
 
 LOGGER = logging.getLogger(__name__)
 
+# Follow-up questions for empty job description fields, in the order asked.
+_JOB_DETAIL_PROMPTS: Tuple[str, ...] = (
+    "What is the job title for this role?",
+    "Where is the role primarily located?",
+    "How many years of experience should candidates have?",
+    "Which specific skills are required for this position?",
+    "What are the key responsibilities for this role?",
+    "What is the employment type (e.g. full-time, contract, hybrid)?",
+    "Are there any education requirements or preferred degrees?",
+    "Should candidates possess any particular language skills?",
+    "Are there certifications that are required or preferred?",
+)
+
+_PHASE_BY_VALUE: Dict[str, ConversationPhase] = {phase.value: phase for phase in ConversationPhase}
+
+# Outermost {...} span in free-form crew output.
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Screening message section headings: "Summary"/"Recommendations", optionally
+# prefixed with "## " or "### ", alone on their line.
+_SECTION_HEADING_RE = re.compile(
+    r"^[^\S\n]*(?:###? )?(summary|recommendations)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Metadata fields tried, in order, when naming a candidate.
+_DISPLAY_NAME_FIELDS = attrgetter("candidate_name", "file_name", "current_title", "candidate_id")
+
 
 def _suppress_crewai_tracing_prompt() -> None:
     """Mark CrewAI tracing as initialised to avoid first-run CLI prompt."""
@@ -74,7 +110,16 @@ def _utc_now() -> datetime:
 
 
 def _as_json(value: Any) -> str:
-    return json.dumps(value, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ).decode("utf-8")
+        except TypeError:  # pragma: no cover - fall back for types orjson rejects
+            pass
+    return json.dumps(value, indent=2, ensure_ascii=False, default=str)
 
 
 def _task_output_to_model(task_output: TaskOutput, model_cls: Any) -> Any:
@@ -90,18 +135,18 @@ def _task_output_to_model(task_output: TaskOutput, model_cls: Any) -> Any:
         return model_cls.model_validate(json_dict)
 
     raw = getattr(task_output, "raw", None)
+    if isinstance(raw, dict):
+        # Some CrewAI versions hand back an already-decoded payload.
+        return model_cls.model_validate(raw)
     if raw:
         try:
             return model_cls.model_validate_json(raw)
         except Exception:
             # Try to extract JSON from raw text if it contains extra content
-            import re
-            import json
-            json_match = re.search(r'\{.*\}', raw, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(raw)
             if json_match:
                 try:
-                    json_data = json.loads(json_match.group())
-                    return model_cls.model_validate(json_data)
+                    return model_cls.model_validate_json(json_match.group())
                 except Exception:
                     pass
 
@@ -115,13 +160,12 @@ def _is_job_snapshot_complete(snapshot: JobDescription) -> bool:
         return False
     if snapshot.outstanding_questions:
         return False
-    completeness_markers = [
-        snapshot.location,
-        snapshot.required_skills,
-        snapshot.job_responsibilities,
-        snapshot.experience_level_years,
-    ]
-    return any(bool(marker) for marker in completeness_markers)
+    return bool(
+        snapshot.location
+        or snapshot.required_skills
+        or snapshot.job_responsibilities
+        or snapshot.experience_level_years
+    )
 
 
 def _synchronise_query_controls(chat_state: ChatSessionState) -> None:
@@ -146,43 +190,35 @@ def _derive_missing_job_details(snapshot: JobDescription) -> List[str]:
     if snapshot is None:
         snapshot = JobDescription()
 
-    prompts: List[str] = []
+    # The questions depend only on which fields are empty, so memoise on that.
+    return list(
+        _missing_job_detail_prompts(
+            not snapshot.job_title,
+            not snapshot.location,
+            snapshot.experience_level_years is None,
+            not snapshot.required_skills,
+            not snapshot.job_responsibilities,
+            snapshot.job_type is None,
+            not snapshot.education_requirements,
+            not snapshot.language_requirements,
+            not snapshot.certification_requirements,
+        )
+    )
 
-    if not snapshot.job_title:
-        prompts.append("What is the job title for this role?")
-    if not snapshot.location:
-        prompts.append("Where is the role primarily located?")
-    if snapshot.experience_level_years is None:
-        prompts.append("How many years of experience should candidates have?")
-    if not snapshot.required_skills:
-        prompts.append("Which specific skills are required for this position?")
-    if not snapshot.job_responsibilities:
-        prompts.append("What are the key responsibilities for this role?")
-    if snapshot.job_type is None:
-        prompts.append("What is the employment type (e.g. full-time, contract, hybrid)?")
-    if not snapshot.education_requirements:
-        prompts.append("Are there any education requirements or preferred degrees?")
-    if not snapshot.language_requirements:
-        prompts.append("Should candidates possess any particular language skills?")
-    if not snapshot.certification_requirements:
-        prompts.append("Are there certifications that are required or preferred?")
-
-    return prompts
+
+@lru_cache(maxsize=512)
+def _missing_job_detail_prompts(*missing: bool) -> Tuple[str, ...]:
+    return tuple(prompt for prompt, is_missing in zip(_JOB_DETAIL_PROMPTS, missing) if is_missing)
 
 
 def _merge_outstanding_questions(existing: List[str], derived: List[str]) -> List[str]:
-    seen_lower = set()
-    merged: List[str] = []
-    for question in (existing or []) + (derived or []):
+    # Keyed by lower-cased text; insertion order keeps the first spelling seen.
+    merged: Dict[str, str] = {}
+    for question in chain(existing or (), derived or ()):
         key = question.strip()
-        if not key:
-            continue
-        lower = key.lower()
-        if lower in seen_lower:
-            continue
-        seen_lower.add(lower)
-        merged.append(key)
-    return merged
+        if key:
+            merged.setdefault(key.lower(), key)
+    return list(merged.values())
 
 
 def _conversation_history(messages: List[ChatMessage], limit: int = 20) -> List[Dict[str, Any]]:
@@ -204,30 +240,21 @@ def _conversation_history(messages: List[ChatMessage], limit: int = 20) -> List[
 def _split_screening_message_sections(message_md: str) -> Dict[str, str]:
     if not message_md:
         return {"table": "", "recommendations": ""}
-    lines = message_md.splitlines()
-    table_lines: List[str] = []
+    # Normalise \r\n and other line breaks to \n so they never leak into the
+    # split sections.
+    message_md = "\n".join(message_md.splitlines())
+    # [table, heading, body, heading, body, ...]; summary bodies are dropped and
+    # reasoning is rebuilt separately.
+    parts = _SECTION_HEADING_RE.split(message_md)
+    last = len(parts) - 1
     recommendation_lines: List[str] = []
-    mode = "table"
-    summary_tokens = {"summary", "## summary", "### summary"}
-    recommendation_tokens = {"recommendations", "## recommendations", "### recommendations"}
-    for line in lines:
-        stripped = line.strip()
-        lowered = stripped.lower()
-        if lowered in summary_tokens:
-            mode = "summary"
-            continue
-        if lowered in recommendation_tokens:
-            mode = "recommendations"
-            continue
-        if mode == "table":
-            table_lines.append(line)
-        elif mode == "recommendations":
-            recommendation_lines.append(line)
-        else:
-            # skip summary content; we'll rebuild reasoning separately
-            continue
+    for index in range(1, last, 2):
+        if parts[index].lower() == "recommendations":
+            # Drop the newlines that bordered the heading lines themselves.
+            body_lines = parts[index + 1].split("\n")
+            recommendation_lines.extend(body_lines[1:] if index + 1 == last else body_lines[1:-1])
     return {
-        "table": "\n".join(table_lines).strip(),
+        "table": parts[0].strip(),
         "recommendations": "\n".join(recommendation_lines).strip(),
     }
 
@@ -235,24 +262,27 @@ def _split_screening_message_sections(message_md: str) -> Dict[str, str]:
 def _format_candidate_reasoning(insights: List[CandidateInsight]) -> str:
     if not insights:
         return ""
-    blocks: List[str] = []
+    body = "\n\n".join(_iter_candidate_reasoning_blocks(insights))
+    if not body:
+        return ""
+    return "### Reasoning\n\n" + body
+
+
+def _iter_candidate_reasoning_blocks(insights: List[CandidateInsight]) -> Iterator[str]:
     for idx, insight in enumerate(insights, start=1):
-        candidate_name = _candidate_display_name(insight, idx)
-        heading = f"#### {idx}. {candidate_name}"
-        body_parts: List[str] = []
         summary = (insight.summary_md or "").strip()
-        if summary:
-            body_parts.append(summary)
-        reasoning_points = [point.strip() for point in insight.fit_reasoning or [] if point and point.strip()]
-        if reasoning_points:
-            bullets = "\n".join(f"- {point}" for point in reasoning_points)
-            body_parts.append(bullets)
-        if not body_parts:
+        bullets = "\n".join(
+            f"- {stripped}"
+            for stripped in (point.strip() for point in insight.fit_reasoning or [] if point)
+            if stripped
+        )
+        if not summary and not bullets:
             continue
-        blocks.append(f"{heading}\n\n" + "\n\n".join(body_parts))
-    if not blocks:
-        return ""
-    return "### Reasoning\n\n" + "\n\n".join(blocks)
+        heading = f"#### {idx}. {_candidate_display_name(insight, idx)}\n\n"
+        if summary and bullets:
+            yield heading + summary + "\n\n" + bullets
+        else:
+            yield heading + (summary or bullets)
 
 
 def _format_recommendations(recommendations_md: str) -> str:
@@ -268,96 +298,277 @@ def _format_database_summary(summary_md: Optional[str]) -> str:
     text = (summary_md or "").strip()
     if not text:
         return ""
-    lowered = text.lower()
-    if lowered.startswith("#") or lowered.startswith("database summary"):
+    if text.lower().startswith(("#", "database summary")):
         return text
     return "### Database Summary\n\n" + text
 
 
 def _candidate_display_name(insight: CandidateInsight, index: int) -> str:
-    metadata = insight.metadata or Metadata()
-    return (
-        (metadata.candidate_name or "").strip()
-        or (metadata.file_name or "").strip()
-        or (metadata.current_title or "").strip()
-        or (metadata.candidate_id or "").strip()
-        or f"Candidate {index}"
-    )
+    metadata = insight.metadata
+    if metadata is not None:
+        for value in _DISPLAY_NAME_FIELDS(metadata):
+            if value:
+                stripped = value.strip()
+                if stripped:
+                    return stripped
+    return f"Candidate {index}"
+
+
+def _candidate_table_row(rank: int, insight: CandidateInsight, score: Any) -> str:
+    candidate_name = _candidate_display_name(insight, rank)
+    score_text = f"{score:.1f}" if isinstance(score, (int, float)) else "-"
+    # Construct highlight from specific matched features
+    matched = insight.matched_features
+    parts = []
+
+    if matched.matching_skills:
+        parts.append("Skills: " + ", ".join(islice(matched.matching_skills, 3)))
+
+    if matched.matching_experience:
+        parts.append("Exp: " + ", ".join(islice(matched.matching_experience, 2)))
+
+    if matched.matching_education:
+        parts.append(f"Edu: {matched.matching_education[0]}")
+
+    highlight = "; ".join(parts)
+
+    # Fallback if no specific features matched
+    if not highlight:
+        summary = (insight.summary_md or "").strip().splitlines()[0] if insight.summary_md else ""
+        highlight = summary or (insight.fit_reasoning[0].strip() if insight.fit_reasoning else "")
+
+    if len(highlight) > 140:
+        highlight = highlight[:140] + "…"
+    return f"| {rank} | {candidate_name} | {score_text} | {highlight or '—'} |"
 
 
 def _format_candidate_table(insights: List[CandidateInsight]) -> str:
     if not insights:
         return ""
 
-    sorted_insights = sorted(
-        insights,
-        key=lambda insight: getattr(getattr(insight, "scores", None), "job_fit_score", 0.0),
-        reverse=True,
-    )
+    # Read each score once; it drives both the ordering and the score column.
+    scored = [
+        (getattr(getattr(insight, "scores", None), "job_fit_score", None), insight)
+        for insight in insights
+    ]
+    scored.sort(key=lambda pair: pair[0] or 0.0, reverse=True)
 
     header = "### Candidate Overview\n\n| Rank | Candidate | Fit Score | Highlight |\n| --- | --- | --- | --- |"
-    rows: List[str] = []
-    for idx, insight in enumerate(sorted_insights, start=1):
-        candidate_name = _candidate_display_name(insight, idx)
-        score = getattr(getattr(insight, "scores", None), "job_fit_score", None)
-        score_text = f"{score:.1f}" if isinstance(score, (int, float)) else "-"
-        # Construct highlight from specific matched features
-        matched = insight.matched_features
-        parts = []
-        
-        if matched.matching_skills:
-            skills = ", ".join(matched.matching_skills[:3])
-            parts.append(f"Skills: {skills}")
-            
-        if matched.matching_experience:
-            exp = ", ".join(matched.matching_experience[:2])
-            parts.append(f"Exp: {exp}")
-            
-        if matched.matching_education:
-            edu = matched.matching_education[0]
-            parts.append(f"Edu: {edu}")
-            
-        highlight = "; ".join(parts)
-        
-        # Fallback if no specific features matched
-        if not highlight:
-            summary = (insight.summary_md or "").strip().splitlines()[0] if insight.summary_md else ""
-            highlight = summary or (insight.fit_reasoning[0].strip() if insight.fit_reasoning else "")
-            
-        highlight = highlight[:140] + ("…" if len(highlight) > 140 else "")
-        rows.append(f"| {idx} | {candidate_name} | {score_text} | {highlight or '—'} |")
-
-    return header + "\n" + "\n".join(rows)
+    rows = "\n".join(
+        _candidate_table_row(rank, insight, score)
+        for rank, (score, insight) in enumerate(scored, start=1)
+    )
+    return header + "\n" + rows
 
 
-def _compose_screening_markdown(output: CandidateScreeningOutput) -> str:
-    parts: List[str] = []
+def _iter_screening_sections(output: CandidateScreeningOutput) -> Iterator[str]:
+    """Yield the non-empty, already stripped sections of the screening reply."""
+
     db_summary = _format_database_summary(output.database_summary_md)
     if db_summary:
-        parts.append(db_summary)
+        yield db_summary
+
+    sections = _split_screening_message_sections(output.message_md or "")
 
     candidate_table = _format_candidate_table(output.candidate_insights)
     if candidate_table:
-        parts.append(candidate_table)
-    elif output.message_md:
-        table_candidate_section = _split_screening_message_sections(output.message_md or "").get("table", "").strip()
-        if table_candidate_section:
-            parts.append(table_candidate_section)
+        yield candidate_table
+    elif sections["table"]:
+        yield sections["table"]
 
     reasoning_section = _format_candidate_reasoning(output.candidate_insights)
     if reasoning_section:
-        parts.append(reasoning_section)
+        yield reasoning_section
 
     screening_rationale = (output.reasoning or "").strip()
     if screening_rationale:
-        parts.append("### Screening Rationale\n\n" + screening_rationale)
+        yield "### Screening Rationale\n\n" + screening_rationale
 
     # Preserve any recommendations generated by the crew if present.
-    sections = _split_screening_message_sections(output.message_md or "")
-    recommendations = _format_recommendations(sections.get("recommendations", ""))
+    recommendations = _format_recommendations(sections["recommendations"])
     if recommendations:
-        parts.append(recommendations)
-    return "\n\n".join(part.strip() for part in parts if part and part.strip())
+        yield recommendations
+
+
+def _compose_screening_markdown(output: CandidateScreeningOutput) -> str:
+    return "\n\n".join(_iter_screening_sections(output))
+
+
+class _PlanFlags(NamedTuple):
+    """Routing inputs that decide the execution plan, as a hashable cache key."""
+
+    has_job_title: bool
+    new_job_search: bool
+    update_jd: bool
+    allow_jd_incomplete: bool
+    jd_complete: bool
+    screen_again: bool
+    candidates_ready: bool
+    # Derived once per routing so the planner does not re-evaluate them.
+    needs_jd: bool
+    screening_ok: bool
+
+
+def _try_append_job_description(
+    plan: List[ConversationPhase],
+    requested: AbstractSet[ConversationPhase],
+    flags: _PlanFlags,
+) -> bool:
+    should_run = False
+    if ConversationPhase.job_description in requested:
+        if flags.needs_jd:
+            should_run = True
+    if should_run and ConversationPhase.job_description not in plan:
+        plan.append(ConversationPhase.job_description)
+    return should_run
+
+
+def _try_append_screening(
+    plan: List[ConversationPhase],
+    requested: AbstractSet[ConversationPhase],
+    flags: _PlanFlags,
+) -> bool:
+    if ConversationPhase.screening not in requested:
+        return False
+    if not flags.screening_ok:
+        return False
+    if ConversationPhase.screening not in plan:
+        plan.append(ConversationPhase.screening)
+    return True
+
+
+def _try_append_discussion(
+    plan: List[ConversationPhase],
+    requested: AbstractSet[ConversationPhase],
+    flags: _PlanFlags,
+) -> bool:
+    if ConversationPhase.discussion not in requested:
+        return False
+    if not flags.candidates_ready:
+        return False
+    if ConversationPhase.discussion not in plan:
+        plan.append(ConversationPhase.discussion)
+    return True
+
+
+# Handler that schedules the first requested phase of a routing decision.
+_FIRST_PHASE_HANDLERS: Dict[
+    ConversationPhase,
+    Callable[[List[ConversationPhase], AbstractSet[ConversationPhase], _PlanFlags], bool],
+] = {
+    ConversationPhase.job_description: _try_append_job_description,
+    ConversationPhase.screening: _try_append_screening,
+    ConversationPhase.discussion: _try_append_discussion,
+}
+
+
+def _plan_for(requested: Tuple[ConversationPhase, ...], flags: _PlanFlags) -> Tuple[ConversationPhase, ...]:
+    """Translate requested phases and routing flags into the phases to execute.
+
+    Pure in its arguments; common request shapes are precomputed in ``_PLAN_TABLE``.
+    """
+
+    plan: List[ConversationPhase] = []
+
+    if not requested:
+        if flags.needs_jd:
+            requested = (ConversationPhase.job_description,)
+        elif flags.screening_ok:
+            requested = (ConversationPhase.screening,)
+        elif flags.candidates_ready:
+            requested = (ConversationPhase.discussion,)
+
+    # Fast path: a single screening or discussion request that is already
+    # eligible. The job description handler cannot select anything here.
+    if len(requested) == 1:
+        only = requested[0]
+        if only is ConversationPhase.screening and flags.screening_ok:
+            return (only,)
+        if only is ConversationPhase.discussion and flags.candidates_ready:
+            return (only,)
+
+    sequential_requested = (
+        len(requested) == 2
+        and requested[0] is ConversationPhase.job_description
+        and requested[1] is ConversationPhase.screening
+    )
+    # The tuple keeps request order; membership checks go through the set.
+    requested_set = frozenset(requested)
+
+    job_selected = _try_append_job_description(plan, requested_set, flags)
+
+    if sequential_requested:
+        if ConversationPhase.job_description in requested_set and not job_selected:
+            plan.append(ConversationPhase.job_description)
+            job_selected = True
+
+        if flags.new_job_search:
+            return tuple(plan)
+        if flags.update_jd and not (flags.allow_jd_incomplete or flags.jd_complete):
+            return tuple(plan)
+
+        _try_append_screening(plan, requested_set, flags)
+        return tuple(plan)
+
+    if not requested:
+        return tuple(plan)
+
+    # Only the first requested phase is scheduled; re-running the job
+    # description handler is a no-op when it was already selected above.
+    _FIRST_PHASE_HANDLERS[requested[0]](plan, requested_set, flags)
+    return tuple(plan)
+
+
+# Bit assigned to each routing flag in a plan mask.
+_FLAG_NEW_JOB_SEARCH = 1
+_FLAG_UPDATE_JD = 2
+_FLAG_ALLOW_JD_INCOMPLETE = 4
+_FLAG_JD_COMPLETE = 8
+_FLAG_SCREEN_AGAIN = 16
+_FLAG_CANDIDATES_READY = 32
+_FLAG_HAS_JOB_TITLE = 64
+_FLAG_MASK_LIMIT = 128
+
+
+def _plan_flags_from_mask(mask: int) -> _PlanFlags:
+    has_job_title = bool(mask & _FLAG_HAS_JOB_TITLE)
+    new_job_search = bool(mask & _FLAG_NEW_JOB_SEARCH)
+    update_jd = bool(mask & _FLAG_UPDATE_JD)
+    allow_jd_incomplete = bool(mask & _FLAG_ALLOW_JD_INCOMPLETE)
+    jd_complete = bool(mask & _FLAG_JD_COMPLETE)
+    screen_again = bool(mask & _FLAG_SCREEN_AGAIN)
+    return _PlanFlags(
+        has_job_title=has_job_title,
+        new_job_search=new_job_search,
+        update_jd=update_jd,
+        allow_jd_incomplete=allow_jd_incomplete,
+        jd_complete=jd_complete,
+        screen_again=screen_again,
+        candidates_ready=bool(mask & _FLAG_CANDIDATES_READY),
+        needs_jd=update_jd or new_job_search or not has_job_title,
+        screening_ok=allow_jd_incomplete or jd_complete or screen_again,
+    )
+
+
+def _build_plan_table() -> Dict[Tuple[Tuple[ConversationPhase, ...], int], Tuple[ConversationPhase, ...]]:
+    """Precompute plans for the request shapes the query manager emits."""
+
+    shapes: Tuple[Tuple[ConversationPhase, ...], ...] = (
+        (),
+        (ConversationPhase.job_description,),
+        (ConversationPhase.screening,),
+        (ConversationPhase.discussion,),
+        (ConversationPhase.job_description, ConversationPhase.screening),
+    )
+    return {
+        (shape, mask): _plan_for(shape, _plan_flags_from_mask(mask))
+        for shape in shapes
+        for mask in range(_FLAG_MASK_LIMIT)
+    }
+
+
+# (requested phases, flag mask) -> plan. Other request shapes fall back to _plan_for.
+_PLAN_TABLE = _build_plan_table()
 
 
 class ResumeAssistantFlow(Flow[ResumeAssistantFlowState]):
@@ -379,6 +590,7 @@ class ResumeAssistantFlow(Flow[ResumeAssistantFlowState]):
         self.state.turn_finalised = False
         self.state.completed_phases = []
         self.state.execution_plan = []
+        self.state.execution_plan_set = frozenset()
 
         chat_state = self.state.chat_state
         self._memory_bundle()  # ensure storage dir is active for the turn
@@ -443,6 +655,7 @@ class ResumeAssistantFlow(Flow[ResumeAssistantFlowState]):
 
         execution_plan = self._calculate_execution_plan(routing)
         self.state.execution_plan = execution_plan
+        self.state.execution_plan_set = frozenset(execution_plan)
         chat_state.pending_phases = list(execution_plan)
         if not execution_plan and routing.query_controls.phase_sequence:
             self._logger.info(
@@ -637,21 +850,12 @@ class ResumeAssistantFlow(Flow[ResumeAssistantFlowState]):
             self._logger.info("Skipping discussion crew because no screening analysis is available")
             return None
 
-        try:
-            analysis_payload: Optional[Any] = analysis_output.model_dump(mode="python")
-        except AttributeError:
-            analysis_payload = analysis_output
-
-        job_snapshot = chat_state.job_snapshot
-        try:
-            job_snapshot_payload: Optional[Any] = job_snapshot.model_dump(mode="python") if job_snapshot else None
-        except AttributeError:
-            job_snapshot_payload = job_snapshot
-
+        # Model instances are accepted as-is by DiscussionInput, so hand them over
+        # directly instead of dumping to dicts only for pydantic to rebuild them.
         discussion_input = DiscussionInput(
             user_query=self.state.latest_user_message,
-            screened_candidates=analysis_payload,
-            job_snapshot=job_snapshot_payload,
+            screened_candidates=analysis_output,
+            job_snapshot=chat_state.job_snapshot or None,
             phase=ConversationPhase.discussion,
         )
 
@@ -759,116 +963,80 @@ class ResumeAssistantFlow(Flow[ResumeAssistantFlowState]):
             self._logger.debug("Unable to record candidate insights in session memory", exc_info=True)
 
     def _calculate_execution_plan(self, routing: Optional[QueryRoutingOutput]) -> List[ConversationPhase]:
-        plan: List[ConversationPhase] = []
         if routing is None:
-            return plan
+            return []
 
-        chat_state = self.state.chat_state
         controls = routing.query_controls
-        requested_raw = controls.phase_sequence or []
-        requested: List[ConversationPhase] = []
-        for label in requested_raw:
-            try:
-                requested.append(ConversationPhase(label))
-            except ValueError:
-                self._logger.warning("Ignoring unknown phase label '%s' in routing output", label)
-
-        if not requested:
-            if controls.update_jd or controls.new_job_search or not chat_state.job_snapshot.job_title:
-                requested = [ConversationPhase.job_description]
-            elif controls.allow_jd_incomplete or controls.jd_complete or controls.screen_again:
-                requested = [ConversationPhase.screening]
-            elif controls.candidates_ready:
-                requested = [ConversationPhase.discussion]
-
-        sequential_requested = [phase.value for phase in requested] == [
-            ConversationPhase.job_description.value,
-            ConversationPhase.screening.value,
-        ]
-
-        def include_job_description() -> bool:
-            should_run = False
-            if ConversationPhase.job_description in requested:
-                if controls.update_jd or controls.new_job_search or not chat_state.job_snapshot.job_title:
-                    should_run = True
-            if should_run and ConversationPhase.job_description not in plan:
-                plan.append(ConversationPhase.job_description)
-            return should_run
-
-        def screening_allowed() -> bool:
-            return bool(controls.allow_jd_incomplete or controls.jd_complete or controls.screen_again)
-
-        def include_screening() -> bool:
-            if ConversationPhase.screening not in requested:
-                return False
-            if not screening_allowed():
+        requested_raw = controls.phase_sequence or ()
+        requested: List[ConversationPhase]
+        if requested_raw and all(isinstance(label, ConversationPhase) for label in requested_raw):
+            # Already typed (e.g. plans built in code); no label lookup needed.
+            requested = list(requested_raw)
+        else:
+            requested = []
+            for label in requested_raw:
+                phase = _PHASE_BY_VALUE.get(label)
+                if phase is None:
+                    self._logger.warning("Ignoring unknown phase label '%s' in routing output", label)
+                    continue
+                requested.append(phase)
+
+        mask = (
+            (_FLAG_NEW_JOB_SEARCH if controls.new_job_search else 0)
+            | (_FLAG_UPDATE_JD if controls.update_jd else 0)
+            | (_FLAG_ALLOW_JD_INCOMPLETE if controls.allow_jd_incomplete else 0)
+            | (_FLAG_JD_COMPLETE if controls.jd_complete else 0)
+            | (_FLAG_SCREEN_AGAIN if controls.screen_again else 0)
+            | (_FLAG_CANDIDATES_READY if controls.candidates_ready else 0)
+            | (_FLAG_HAS_JOB_TITLE if self.state.chat_state.job_snapshot.job_title else 0)
+        )
+        requested_key = tuple(requested)
+        plan = _PLAN_TABLE.get((requested_key, mask))
+        if plan is None:
+            plan = _plan_for(requested_key, _plan_flags_from_mask(mask))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log_skipped_phases(requested_key, plan, mask)
+        return list(plan)
+
+    def _log_skipped_phases(
+        self,
+        requested: Tuple[ConversationPhase, ...],
+        plan: Tuple[ConversationPhase, ...],
+        mask: int,
+    ) -> None:
+        if ConversationPhase.screening in requested and ConversationPhase.screening not in plan:
+            if not mask & (_FLAG_ALLOW_JD_INCOMPLETE | _FLAG_JD_COMPLETE | _FLAG_SCREEN_AGAIN):
                 self._logger.debug(
                     "Skipping screening because allow_jd_incomplete/jd_complete/screen_again flags are not set"
                 )
-                return False
-            if ConversationPhase.screening not in plan:
-                plan.append(ConversationPhase.screening)
-            return True
-
-        def include_discussion() -> bool:
-            if ConversationPhase.discussion not in requested:
-                return False
-            if not controls.candidates_ready:
+        if ConversationPhase.discussion in requested and ConversationPhase.discussion not in plan:
+            if not mask & _FLAG_CANDIDATES_READY:
                 self._logger.debug("Skipping discussion because candidates_ready flag is false")
-                return False
-            if ConversationPhase.discussion not in plan:
-                plan.append(ConversationPhase.discussion)
-            return True
-
-        job_selected = include_job_description()
-
-        if sequential_requested:
-            if ConversationPhase.job_description in requested and not job_selected:
-                plan.append(ConversationPhase.job_description)
-                job_selected = True
-
-            if controls.new_job_search:
-                return plan
-            if controls.update_jd and not (controls.allow_jd_incomplete or controls.jd_complete):
-                return plan
-
-            include_screening()
-            return plan
-
-        if not requested:
-            return plan
-
-        first = requested[0]
-        if first is ConversationPhase.job_description:
-            if not job_selected:
-                include_job_description()
-        elif first is ConversationPhase.screening:
-            include_screening()
-        elif first is ConversationPhase.discussion:
-            include_discussion()
-
-        return plan
 
     def _should_run_phase(
         self,
         routing: Optional[QueryRoutingOutput],
         phase: ConversationPhase,
     ) -> bool:
-        if routing is None:
-            return False
-        plan = self.state.execution_plan or []
-        return phase in plan
+        return routing is not None and phase in self.state.execution_plan_set
 
     def _append_assistant_message(self, content: str, phase: ConversationPhase) -> None:
-        message = ChatMessage(
-            role="assistant",
-            content_md=content,
-            phase=phase,
-            timestamp=_utc_now(),
-        )
-        self.state.chat_state.messages.append(message)
-        self.state.turn_responses.append(message)
-        self._record_message_in_memory(message)
+        self._append_assistant_messages([(content, phase)])
+
+    def _append_assistant_messages(self, entries: Iterable[Tuple[str, ConversationPhase]]) -> None:
+        """Append several assistant messages with one timestamp and one list extend each."""
+
+        timestamp = _utc_now()
+        messages = [
+            ChatMessage(role="assistant", content_md=content, phase=phase, timestamp=timestamp)
+            for content, phase in entries
+        ]
+        if not messages:
+            return
+        self.state.chat_state.messages.extend(messages)
+        self.state.turn_responses.extend(messages)
+        for message in messages:
+            self._record_message_in_memory(message)
 
 
 def build_flow(
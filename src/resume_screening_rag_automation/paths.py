@@ -36,6 +36,12 @@ STRUCTURED_RESUMES_PATH = DATA_ROOT / "structured_resumes.json"
 # Persistent Chroma vector store used for resume embeddings.
 CHROMA_VECTOR_DIR = DATA_ROOT / "chroma_vectorstore"
 
+# Local embedding cache. Kept outside DATA_ROOT so storage sync never uploads
+# or restores a live SQLite file.
+EMBEDDING_CACHE_DIR = Path(
+    os.getenv("EMBEDDING_CACHE_PATH", PROJECT_ROOT / ".embedding_cache")
+).resolve()
+
 
 def ensure_data_directories() -> None:
     """Create the standard directory layout if it does not already exist."""
@@ -86,6 +92,7 @@ __all__ = [
     "SCREENING_INSIGHTS_DIR",
     "STRUCTURED_RESUMES_PATH",
     "CHROMA_VECTOR_DIR",
+    "EMBEDDING_CACHE_DIR",
     "QUERY_MANAGER_SCENARIO_DIR",
     "QUERY_MANAGER_SCENARIO_FILE",
     "ensure_data_directories",
@@ -7,11 +7,20 @@ import logging
 import os
 import re
 import hashlib
+import mmap
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+try:  # pragma: no cover - orjson is an optional speed-up for the resume store.
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json.
+    orjson = None
 
 from resume_screening_rag_automation.core.ingestion_models import (
     ResumeIngestionOutput,
@@ -35,6 +44,7 @@ from resume_screening_rag_automation.tools.constants import RESUME_COLLECTION_NA
 
 
 logger = logging.getLogger(__name__)
+_T = TypeVar("_T")
 
 PACKAGE_ROOT = Path(__file__).resolve().parent
 PROJECT_ROOT = PACKAGE_ROOT.parent
@@ -56,12 +66,32 @@ _KNOWLEDGE_FILE_CANDIDATES: Tuple[Path, ...] = (
     REPO_ROOT / "structured_resumes.json",
 )
 
+# Sidecar in the resume folder mapping file name -> [mtime_ns, size, sha256].
+_HASH_CACHE_FILENAME = ".content_hashes.json"
+_HashCache = Dict[str, List[Any]]
+# Files at least this large are hashed through mmap instead of one read().
+_MMAP_THRESHOLD = 1 << 20
+# Process-wide memo of (path, mtime_ns, size) -> sha256, most recent last.
+_HASH_MEMO: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_HASH_MEMO_LIMIT = 8192
+_HASH_MEMO_LOCK = threading.Lock()
+# Threads used to stat and hash a resume folder; reads are syscall-bound.
+_HASH_WORKERS = 8
+
 _MAX_FILES_PER_CREW_BATCH = 1
 _MAX_PARALLEL_CREWS = 4
 _PIPELINE_STATE: Dict[str, Any] = {"monitor": None, "ingestion": None, "ran": False}
 
 _CANDIDATE_PATTERN = re.compile(r"^CAND(\d+)$", re.IGNORECASE)
-_SUMMARY_SECTION_TOKENS = ("summary", "profile", "professional summary", "objective")
+_NON_ALPHA_RE = re.compile(r"[^A-Za-z\s]")
+_MULTI_WS_RE = re.compile(r"\s+")
+_STEM_SPLIT_RE = re.compile(r"[\s_]+")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Leading characters split first when looking for the candidate name line.
+_NAME_SCAN_CHARS = 1024
+_SUMMARY_SECTION_TOKENS = frozenset(("summary", "profile", "professional summary", "objective"))
+# Longest token above; longer lines can only match once edge ":"/"-" are stripped.
+_SUMMARY_TOKEN_MAX_LEN = max(map(len, _SUMMARY_SECTION_TOKENS))
 
 
 def _utc_now_iso() -> str:
@@ -80,12 +110,15 @@ def _clean_string(value: Any) -> str:
     return text
 
 
+# Folds every skill separator onto "\n" so one split handles them all.
+_SKILL_SEPARATOR_TABLE = str.maketrans({",": "\n", "/": "\n", "|": "\n", "•": "\n", "*": "\n"})
+
+
 def _explode_skill_text(text: str) -> List[str]:
-    separators = [",", "/", "\n", "|", "•", "*"]
-    if any(separator in text for separator in separators):
-        parts = re.split(r",|/|\n|\||•|\*", text)
-        return [part.strip() for part in parts if part.strip()]
-    return [text.strip()]
+    translated = text.translate(_SKILL_SEPARATOR_TABLE)
+    if "\n" not in translated:
+        return [text.strip()]
+    return [part for part in (piece.strip() for piece in translated.split("\n")) if part]
 
 
 def _dedupe(items: Iterable[str]) -> List[str]:
@@ -103,22 +136,38 @@ def _dedupe(items: Iterable[str]) -> List[str]:
     return result
 
 
+def _iter_resume_lines(text: str) -> Iterator[str]:
+    """Yield ``text.splitlines()`` lazily, splitting only a short head up front.
+
+    Callers that stop at an early line never split the rest of the resume.
+    """
+
+    head = text[:_NAME_SCAN_CHARS]
+    if len(head) == len(text):
+        yield from head.splitlines()
+        return
+    # The head's last line may be cut short; leave it to the full split.
+    lines = head.splitlines()[:-1]
+    yield from lines
+    yield from islice(text.splitlines(), len(lines), None)
+
+
 def _guess_candidate_name(text: str, file_name: str) -> Optional[str]:
     if text:
-        for line in text.splitlines():
+        for line in _iter_resume_lines(text):
             stripped = line.strip()
             if not stripped:
                 continue
-            cleaned = re.sub(r"[^A-Za-z\s]", " ", stripped)
-            cleaned = re.sub(r"\s+", " ", cleaned).strip()
+            cleaned = _NON_ALPHA_RE.sub(" ", stripped)
+            cleaned = _MULTI_WS_RE.sub(" ", cleaned).strip()
             if not cleaned:
                 continue
             word_count = len(cleaned.split())
             if 1 <= word_count <= 6 and 2 <= len(cleaned) <= 80:
                 return cleaned.title()
     stem = Path(file_name).stem
-    stem_clean = re.sub(r"[^A-Za-z\s]", " ", stem)
-    parts = [part for part in re.split(r"[\s_]+", stem_clean) if part]
+    stem_clean = _NON_ALPHA_RE.sub(" ", stem)
+    parts = [part for part in _STEM_SPLIT_RE.split(stem_clean) if part]
     filtered = [part for part in parts if part.lower() not in {"resume", "cv", "copy"}]
     if filtered:
         return " ".join(part.capitalize() for part in filtered)
@@ -170,14 +219,15 @@ def _load_structured_resumes(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
     try:
-        raw = path.read_text(encoding="utf-8")
+        raw = path.read_bytes() if orjson is not None else path.read_text(encoding="utf-8")
     except Exception:
         logger.exception("Failed to read knowledge file at %s", path)
         return []
     if not raw.strip():
         return []
     try:
-        data = json.loads(raw)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError:
         logger.exception("Invalid JSON in %s", path)
         return []
@@ -190,17 +240,84 @@ def _load_structured_resumes(path: Path) -> List[Dict[str, Any]]:
 def _save_structured_resumes(path: Path, data: Sequence[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        path.write_text(json.dumps(list(data), indent=2, ensure_ascii=False), encoding="utf-8")
+        path.write_bytes(_dump_structured_resumes(list(data)))
     except Exception:
         logger.exception("Failed to write knowledge file at %s", path)
 
 
+def _dump_structured_resumes(records: List[Dict[str, Any]]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # pragma: no cover - e.g. integers beyond 64 bits
+            pass
+    return json.dumps(records, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def _compute_file_hash(path: Path) -> str:
-    hasher = hashlib.sha256()
+    # SHA-256 is kept because digests are persisted as ``content_hash`` in the
+    # structured resume store; changing it would flag every resume as modified.
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        size = os.fstat(handle.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return hashlib.sha256(handle.read()).hexdigest()
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+def _load_hash_cache(resume_dir: Path) -> _HashCache:
+    cache_path = resume_dir / _HASH_CACHE_FILENAME
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError):
+        logger.debug("Ignoring unreadable resume hash cache at %s", cache_path, exc_info=True)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_hash_cache(resume_dir: Path, cache: _HashCache) -> None:
+    cache_path = resume_dir / _HASH_CACHE_FILENAME
+    try:
+        cache_path.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+    except OSError:  # pragma: no cover - cache is best effort
+        logger.debug("Unable to write resume hash cache at %s", cache_path, exc_info=True)
+
+
+def _cached_file_hash(path: Path, stats: os.stat_result, hash_cache: Optional[_HashCache]) -> str:
+    """Return the content hash of ``path``, reusing the cache while mtime and size match."""
+
+    if hash_cache is None:
+        return _memoised_file_hash(path, stats)
+    entry = hash_cache.get(path.name)
+    if (
+        isinstance(entry, list)
+        and len(entry) == 3
+        and entry[0] == stats.st_mtime_ns
+        and entry[1] == stats.st_size
+    ):
+        return entry[2]
+    file_hash = _memoised_file_hash(path, stats)
+    hash_cache[path.name] = [stats.st_mtime_ns, stats.st_size, file_hash]
+    return file_hash
+
+
+def _memoised_file_hash(path: Path, stats: os.stat_result) -> str:
+    """Hash ``path`` at most once per process for a given mtime and size."""
+
+    key = (str(path), stats.st_mtime_ns, stats.st_size)
+    with _HASH_MEMO_LOCK:
+        cached = _HASH_MEMO.get(key)
+        if cached is not None:
+            _HASH_MEMO.move_to_end(key)
+            return cached
+    file_hash = _compute_file_hash(path)
+    with _HASH_MEMO_LOCK:
+        _HASH_MEMO[key] = file_hash
+        if len(_HASH_MEMO) > _HASH_MEMO_LIMIT:
+            _HASH_MEMO.popitem(last=False)
+    return file_hash
 
 
 def _format_mtime(stats: os.stat_result) -> str:
@@ -212,24 +329,31 @@ def _format_mtime(stats: os.stat_result) -> str:
     )
 
 
-def _list_resume_files(root: Path) -> List[ResumeFileInfo]:
-    candidates: List[ResumeFileInfo] = []
-    for path in sorted(root.glob("*.txt")):
-        if not path.is_file():
-            continue
+def _map_resume_paths(func: Callable[[Path], _T], paths: Sequence[Path]) -> List[_T]:
+    """Apply ``func`` to ``paths`` in order, overlapping file I/O across threads."""
+
+    if len(paths) < 2:
+        return [func(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(_HASH_WORKERS, len(paths))) as executor:
+        return list(executor.map(func, paths))
+
+
+def _list_resume_files(root: Path, hash_cache: Optional[_HashCache] = None) -> List[ResumeFileInfo]:
+    def _describe(path: Path) -> ResumeFileInfo:
         stats = path.stat()
-        info = ResumeFileInfo(
+        return ResumeFileInfo(
             file_name=path.name,
             path=str(path.resolve()),
             size_bytes=stats.st_size,
             modified_at=_format_mtime(stats),
-            content_hash=_compute_file_hash(path),
+            content_hash=_cached_file_hash(path, stats, hash_cache),
         )
-        candidates.append(info)
-    return candidates
+
+    paths = [path for path in sorted(root.glob("*.txt")) if path.is_file()]
+    return _map_resume_paths(_describe, paths)
 
 
-def _prune_duplicate_resume_files(resume_dir: Path) -> None:
+def _prune_duplicate_resume_files(resume_dir: Path, hash_cache: Optional[_HashCache] = None) -> None:
     """Remove duplicate resume files by content hash, keeping the newest copy."""
     if not resume_dir.exists():
         return
@@ -237,15 +361,19 @@ def _prune_duplicate_resume_files(resume_dir: Path) -> None:
     winners: Dict[str, Dict[str, Any]] = {}
     duplicates: List[Path] = []
 
-    for path in sorted(resume_dir.glob("*.txt")):
-        if not path.is_file():
-            continue
+    def _inspect(path: Path) -> Optional[Tuple[os.stat_result, str]]:
         try:
             stats = path.stat()
-            file_hash = _compute_file_hash(path)
+            return stats, _cached_file_hash(path, stats, hash_cache)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning("Unable to inspect %s: %s", path, exc)
+            return None
+
+    paths = [path for path in sorted(resume_dir.glob("*.txt")) if path.is_file()]
+    for path, inspected in zip(paths, _map_resume_paths(_inspect, paths)):
+        if inspected is None:
             continue
+        stats, file_hash = inspected
 
         record = {"path": path, "mtime": stats.st_mtime}
         existing = winners.get(file_hash)
@@ -306,20 +434,35 @@ def _build_resume_file_info_from_record(record: Dict[str, Any], *, resume_dir: O
     )
 
 
-def _next_candidate_counter(records: Sequence[Dict[str, Any]]) -> int:
+def _index_existing_records(
+    records: Sequence[Dict[str, Any]],
+) -> Tuple[Dict[str, dict], Dict[str, dict], int]:
+    """Index stored records by content hash and file name and find the highest CAND counter.
+
+    The first record wins for each hash and file name.
+    """
+
+    by_hash: Dict[str, dict] = {}
+    by_file: Dict[str, dict] = {}
     max_counter = 0
     for record in records:
-        meta = record.get("metadata", {}) or {}
-        candidate_id = _clean_string(meta.get("candidate_id"))
-        if not candidate_id:
+        meta = (record.get("metadata") or {}) if isinstance(record, dict) else {}
+        if not isinstance(meta, dict):
             continue
-        match = _CANDIDATE_PATTERN.match(candidate_id)
-        if match:
-            try:
-                max_counter = max(max_counter, int(match.group(1)))
-            except ValueError:
-                continue
-    return max_counter
+        existing_hash = _clean_string(meta.get("content_hash")).lower()
+        if existing_hash and existing_hash not in by_hash:
+            by_hash[existing_hash] = record
+        existing_file = _clean_string(meta.get("file_name")).lower()
+        if existing_file and existing_file not in by_file:
+            by_file[existing_file] = record
+        candidate_id = _clean_string(meta.get("candidate_id"))
+        if candidate_id:
+            match = _CANDIDATE_PATTERN.match(candidate_id)
+            if match:
+                counter = int(match.group(1))
+                if counter > max_counter:
+                    max_counter = counter
+    return by_hash, by_file, max_counter
 
 
 def _extract_summary(full_text: str) -> Optional[str]:
@@ -332,21 +475,18 @@ def _extract_summary(full_text: str) -> Optional[str]:
     summary_lines: List[str] = []
     capture = False
     for line in lines:
-        lowered = line.lower().strip(":-")
-        if lowered in _SUMMARY_SECTION_TOKENS:
+        if (
+            len(line) <= _SUMMARY_TOKEN_MAX_LEN or line[0] in ":-" or line[-1] in ":-"
+        ) and line.lower().strip(":-") in _SUMMARY_SECTION_TOKENS:
             capture = True
             continue
         if capture:
-            if lowered.isupper() and len(lowered.split()) <= 4:
-                break
             summary_lines.append(line)
             if len(summary_lines) >= 5:
                 break
     if not summary_lines:
         summary_lines = lines[:3]
-    summary = " ".join(summary_lines)
-    summary = re.sub(r"\s+", " ", summary).strip()
-    return summary or None
+    return " ".join(" ".join(summary_lines).split()) or None
 
 
 def _normalise_experience(raw_items: Any) -> List[ExperienceItem]:
@@ -472,23 +612,22 @@ def _normalise_languages(raw_items: Any) -> List[str]:
     if raw_items is None:
         return []
 
-    def _flatten(value: Any, bucket: List[str]) -> None:
+    # Depth-first over nested dicts/lists; children are pushed reversed so
+    # leaves come out in document order.
+    raw_values: List[str] = []
+    stack: List[Any] = [raw_items]
+    while stack:
+        value = stack.pop()
         if value is None:
-            return
+            continue
         if isinstance(value, dict):
-            for item in value.values():
-                _flatten(item, bucket)
-            return
-        if isinstance(value, list):
-            for item in value:
-                _flatten(item, bucket)
-            return
-        cleaned = _clean_string(value)
-        if cleaned:
-            bucket.append(cleaned)
-
-    raw_values: List[str] = []
-    _flatten(raw_items, raw_values)
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+        else:
+            cleaned = _clean_string(value)
+            if cleaned:
+                raw_values.append(cleaned)
     languages: List[str] = []
     for value in raw_values:
         for candidate in _explode_skill_text(value):
@@ -502,7 +641,7 @@ def _normalise_languages(raw_items: Any) -> List[str]:
 
 
 def _slugify_section(name: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "_", name.strip().lower())
+    slug = _SLUG_RE.sub("_", name.strip().lower())
     return slug.strip("_") or "section"
 
 
@@ -521,12 +660,21 @@ def _collect_other_sections(content: Dict[str, Any], consumed: set[str]) -> Dict
 
 def run_resume_folder_monitor() -> Tuple[ResumeMonitorOutput, List[ResumeFileInfo]]:
     resume_dir = _resolve_resume_directory()
+    hash_cache: Optional[_HashCache] = None
     if resume_dir:
-        _prune_duplicate_resume_files(resume_dir)
+        # Unchanged files (same mtime and size) skip re-hashing across runs.
+        hash_cache = _load_hash_cache(resume_dir)
+        cached_before = dict(hash_cache)
+        _prune_duplicate_resume_files(resume_dir, hash_cache)
     knowledge_path = _resolve_knowledge_path()
     existing_records = _load_structured_resumes(knowledge_path)
     inspected_at = _utc_now_iso()
-    files = _list_resume_files(resume_dir) if resume_dir else []
+    files = _list_resume_files(resume_dir, hash_cache) if resume_dir else []
+    if resume_dir and hash_cache is not None:
+        live_names = {info.file_name for info in files}
+        hash_cache = {name: entry for name, entry in hash_cache.items() if name in live_names}
+        if hash_cache != cached_before:
+            _save_hash_cache(resume_dir, hash_cache)
 
     monitor_output = _calculate_resume_deltas(
         files,
@@ -685,24 +833,11 @@ def apply_ingestion_updates(
     existing_records = _load_structured_resumes(knowledge_file)
     removed_list = list(removed_files or [])
 
-    existing_by_hash: Dict[str, dict] = {}
-    existing_by_file: Dict[str, dict] = {}
-    for record in existing_records:
-        meta = (record.get("metadata") or {}) if isinstance(record, dict) else {}
-        if not isinstance(meta, dict):
-            continue
-        existing_hash = _clean_string(meta.get("content_hash")).lower()
-        existing_file = _clean_string(meta.get("file_name")).lower()
-        if existing_hash and existing_hash not in existing_by_hash:
-            existing_by_hash[existing_hash] = record
-        if existing_file and existing_file not in existing_by_file:
-            existing_by_file[existing_file] = record
+    existing_by_hash, existing_by_file, next_counter = _index_existing_records(existing_records)
 
     warnings: List[str] = []
     start_time = perf_counter()
 
-    next_counter = _next_candidate_counter(existing_records)
-
     new_resumes: List[Resume] = []
     records_for_store: List[dict] = []
     embedded_candidate_ids: set[str] = set()
@@ -6,7 +6,7 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, MutableMapping, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, MutableMapping, Optional, Tuple
 from uuid import uuid4
 
 from crewai.flow.flow import FlowState
@@ -112,6 +112,8 @@ class ResumeAssistantFlowState(FlowState):
     turn_finalised: bool = False
     errors: List[str] = Field(default_factory=list)
     execution_plan: List[ConversationPhase] = Field(default_factory=list)
+    # Membership view of execution_plan, refreshed whenever the plan is assigned.
+    execution_plan_set: FrozenSet[ConversationPhase] = Field(default_factory=frozenset)
     completed_phases: List[ConversationPhase] = Field(default_factory=list)
 
 
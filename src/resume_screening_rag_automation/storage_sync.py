@@ -10,7 +10,9 @@ import mimetypes
 import os
 import shutil
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, Optional
 
@@ -293,6 +295,10 @@ class KnowledgeStoreSync:
 		self._dirty = False
 		self._last_digest: Optional[str] = None
 		self._last_flush = 0.0
+		self._flush_lock = threading.Lock()
+		self._queue_lock = threading.Lock()
+		self._executor: Optional[ThreadPoolExecutor] = None
+		self._pending: Optional[Future] = None
 		if self._backend:
 			atexit.register(self.flush)
 
@@ -346,12 +352,32 @@ class KnowledgeStoreSync:
 		if self._backend:
 			self._dirty = True
 
+	def flush_in_background(self) -> None:
+		"""Queue ``flush_if_needed`` on a single sync worker so callers never block on uploads."""
+
+		if not self._backend:
+			return
+
+		with self._queue_lock:
+			pending = self._pending
+			if pending is not None and not pending.running() and not pending.done():
+				return  # a queued flush will pick up this change as well
+			if self._executor is None:
+				self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="knowledge-sync")
+				# Registered after self.flush, so atexit drains the worker first.
+				atexit.register(self._executor.shutdown, wait=True)
+			self._pending = self._executor.submit(self.flush_if_needed)
+
 	def flush_if_needed(self, *, force: bool = False) -> None:
 		"""Upload remote objects when the local tree changes."""
 
 		if not self._backend:
 			return
 
+		with self._flush_lock:
+			self._flush_locked(force=force)
+
+	def _flush_locked(self, *, force: bool) -> None:
 		if not (force or self._dirty):
 			return
 
@@ -15,7 +15,6 @@ from resume_screening_rag_automation.tools.vectorstore_utils import ensure_chrom
 
 LOGGER = logging.getLogger(__name__)
 
-
 def _build_job_query(job: JobDescription) -> str:
     parts: List[str] = []
     if job.job_title:
@@ -52,6 +51,54 @@ def _distance_to_similarity(distance: Any) -> float:
     return round(1.0 / (1.0 + value), 4)
 
 
+def _candidate_evidence(
+    collection: Any,
+    query_args: Dict[str, Any],
+    candidate_id: str,
+    top_k: int,
+) -> Dict[str, Any]:
+    chunks: List[Dict[str, Any]] = []
+    seen_chunk_ids: set[str] = set()
+    for where in ({"candidate_id": candidate_id}, {"file_name": candidate_id}):
+        try:
+            result = collection.query(
+                **query_args,
+                n_results=top_k,
+                where=where,
+                include=["documents", "metadatas", "distances"],
+            )
+        except Exception:
+            LOGGER.debug("Candidate evidence query failed for %s", candidate_id, exc_info=True)
+            continue
+
+        docs = result.get("documents", [[]])[0]
+        metas = result.get("metadatas", [[]])[0]
+        distances = result.get("distances", [[]])[0]
+        ids = result.get("ids", [[]])[0]
+        for idx, doc in enumerate(docs):
+            chunk_id = ids[idx] if idx < len(ids) else ""
+            if chunk_id in seen_chunk_ids:
+                continue
+            seen_chunk_ids.add(chunk_id)
+            metadata = metas[idx] if idx < len(metas) else {}
+            distance = distances[idx] if idx < len(distances) else None
+            chunks.append(
+                {
+                    "id": chunk_id,
+                    "text": doc,
+                    "similarity": _distance_to_similarity(distance),
+                    "metadata": metadata,
+                }
+            )
+        if len(chunks) >= top_k:
+            break
+
+    return {
+        "candidate_id": candidate_id,
+        "chunks": chunks[:top_k],
+    }
+
+
 class CandidateEvidenceInput(BaseModel):
     job_description: Dict[str, Any] = Field(default_factory=dict, description="Structured job description payload")
     candidates: Sequence[str] = Field(..., description="Candidate identifiers (candidate_id or resume file names)")
@@ -120,58 +167,25 @@ class CandidateEvidenceTool(BaseTool):
             }
 
         client = ensure_chroma_client()
+        embedding_function = get_embedding_function()
         collection = client.get_or_create_collection(
             collection_name or RESUME_COLLECTION_NAME,
-            embedding_function=get_embedding_function(),
+            embedding_function=embedding_function,
         )
 
-        evidence: List[Dict[str, Any]] = []
-        for candidate in candidates:
-            candidate_id = str(candidate).strip()
-            if not candidate_id:
-                continue
-            chunks: List[Dict[str, Any]] = []
-            seen_chunk_ids: set[str] = set()
-            for where in ({"candidate_id": candidate_id}, {"file_name": candidate_id}):
-                try:
-                    result = collection.query(
-                        query_texts=[query],
-                        n_results=top_k,
-                        where=where,
-                        include=["documents", "metadatas", "distances"],
-                    )
-                except Exception:
-                    LOGGER.debug("Candidate evidence query failed for %s", candidate_id, exc_info=True)
-                    continue
-
-                docs = result.get("documents", [[]])[0]
-                metas = result.get("metadatas", [[]])[0]
-                distances = result.get("distances", [[]])[0]
-                ids = result.get("ids", [[]])[0]
-                for idx, doc in enumerate(docs):
-                    chunk_id = ids[idx] if idx < len(ids) else ""
-                    if chunk_id in seen_chunk_ids:
-                        continue
-                    seen_chunk_ids.add(chunk_id)
-                    metadata = metas[idx] if idx < len(metas) else {}
-                    distance = distances[idx] if idx < len(distances) else None
-                    chunks.append(
-                        {
-                            "id": chunk_id,
-                            "text": doc,
-                            "similarity": _distance_to_similarity(distance),
-                            "metadata": metadata,
-                        }
-                    )
-                if len(chunks) >= top_k:
-                    break
-
-            evidence.append(
-                {
-                    "candidate_id": candidate_id,
-                    "chunks": chunks[:top_k],
-                }
-            )
+        candidate_ids = [str(candidate).strip() for candidate in candidates]
+        candidate_ids = [candidate_id for candidate_id in candidate_ids if candidate_id]
+
+        # Every lookup uses the same query text, so embed it once instead of
+        # letting Chroma re-embed it for each candidate and filter.
+        query_args: Dict[str, Any] = {"query_texts": [query]}
+        if candidate_ids:
+            try:
+                query_args = {"query_embeddings": [embedding_function([query])[0]]}
+            except Exception:
+                LOGGER.debug("Query embedding failed; letting Chroma embed per lookup", exc_info=True)
+
+        evidence = [_candidate_evidence(collection, query_args, candidate_id, top_k) for candidate_id in candidate_ids]
 
         return {
             "query": query,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -46,17 +47,21 @@ class ScenarioHintIndex:
         self._embedder: Optional[Any] = None
         self._embeddings: Optional[List[np.ndarray]] = None
         self._disabled = not CHROMADB_AVAILABLE
+        # Guards lazy embedder/corpus initialisation when crews share the index.
+        self._lock = threading.RLock()
 
     def _ensure_embedder(self) -> Optional[Any]:
         if self._disabled:
             return None
         if self._embedder is None:
-            try:
-                self._embedder = get_embedding_function(self._model_name)
-            except Exception as exc:  # pragma: no cover - depends on environment
-                LOGGER.warning("Scenario hints disabled: %s", exc)
-                self._disabled = True
-                return None
+            with self._lock:
+                if self._embedder is None and not self._disabled:
+                    try:
+                        self._embedder = get_embedding_function(self._model_name)
+                    except Exception as exc:  # pragma: no cover - depends on environment
+                        LOGGER.warning("Scenario hints disabled: %s", exc)
+                        self._disabled = True
+                        return None
         return self._embedder
 
     @staticmethod
@@ -70,17 +75,20 @@ class ScenarioHintIndex:
     def _ensure_embeddings(self) -> None:
         if self._embeddings is not None or self._disabled:
             return
-        embedder = self._ensure_embedder()
-        if embedder is None:
-            return
-        texts = [entry.text for entry in self._entries]
-        try:
-            raw_vectors = embedder(texts)
-        except Exception as exc:  # pragma: no cover - depends on backend
-            LOGGER.warning("Failed to embed scenario corpus: %s", exc)
-            self._disabled = True
-            return
-        self._embeddings = [self._normalise(vector) for vector in raw_vectors]
+        with self._lock:
+            if self._embeddings is not None or self._disabled:
+                return
+            embedder = self._ensure_embedder()
+            if embedder is None:
+                return
+            texts = [entry.text for entry in self._entries]
+            try:
+                raw_vectors = embedder(texts)
+            except Exception as exc:  # pragma: no cover - depends on backend
+                LOGGER.warning("Failed to embed scenario corpus: %s", exc)
+                self._disabled = True
+                return
+            self._embeddings = [self._normalise(vector) for vector in raw_vectors]
 
     def query(self, text: str, *, top_k: int = 2, min_score: float = 0.25) -> List[Tuple[ScenarioEntry, float]]:
         if not text.strip():
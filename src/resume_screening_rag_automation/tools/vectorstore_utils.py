@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 from typing import Any, Dict, Iterable, Optional, Tuple
 
 from dotenv import load_dotenv, dotenv_values
@@ -61,6 +62,7 @@ except Exception:  # pragma: no cover - optional dependency
 
 _EMBEDDING_CACHE: Dict[Tuple[str, str], Any] = {}
 _CHROMA_CLIENT: Optional[Any] = None
+_CHROMA_CLIENT_LOCK = threading.Lock()
 _TOKEN_ENCODER: Optional[Any] = None
 
 
@@ -237,15 +239,20 @@ def ensure_chroma_client() -> Any:
     if not CHROMADB_AVAILABLE or chromadb is None or Settings is None:
         raise RuntimeError("chromadb not available in environment")
 
-    CHROMA_VECTOR_DIR.mkdir(parents=True, exist_ok=True)
-    settings = Settings(persist_directory=str(CHROMA_VECTOR_DIR), allow_reset=True, is_persistent=True)
-    try:
-        _CHROMA_CLIENT = chromadb.PersistentClient(path=str(CHROMA_VECTOR_DIR), settings=settings)
-        LOGGER.debug("Using persistent Chroma client at %s", CHROMA_VECTOR_DIR)
-    except Exception:  # pragma: no cover - defensive fallback
-        LOGGER.warning("Falling back to in-memory Chroma client", exc_info=True)
-        _CHROMA_CLIENT = chromadb.Client()
-    return _CHROMA_CLIENT
+    # Concurrent first callers must not each open the persistent store.
+    with _CHROMA_CLIENT_LOCK:
+        if _CHROMA_CLIENT is not None:
+            return _CHROMA_CLIENT
+
+        CHROMA_VECTOR_DIR.mkdir(parents=True, exist_ok=True)
+        settings = Settings(persist_directory=str(CHROMA_VECTOR_DIR), allow_reset=True, is_persistent=True)
+        try:
+            _CHROMA_CLIENT = chromadb.PersistentClient(path=str(CHROMA_VECTOR_DIR), settings=settings)
+            LOGGER.debug("Using persistent Chroma client at %s", CHROMA_VECTOR_DIR)
+        except Exception:  # pragma: no cover - defensive fallback
+            LOGGER.warning("Falling back to in-memory Chroma client", exc_info=True)
+            _CHROMA_CLIENT = chromadb.Client()
+        return _CHROMA_CLIENT
 
 
 __all__ = [
@@ -18,9 +18,13 @@ except ModuleNotFoundError:
 # Get the directory where this file is located (app root)
 APP_ROOT = Path(__file__).parent.resolve()
 
-# Add necessary directories to Python path
-sys.path.insert(0, str(APP_ROOT))  # Add app root for 'backend' package
-sys.path.insert(0, str(APP_ROOT / "src"))  # Add src for 'resume_screening_rag_automation'
+# Add necessary directories to Python path, skipping entries already present
+# so repeated imports do not grow sys.path. src/ is added regardless of any
+# installed copy of the package so the checkout is what gets imported.
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))  # Add app root for 'backend' package
+if str(APP_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(APP_ROOT / "src"))  # Add src for 'resume_screening_rag_automation'
 
 print("=" * 60)
 print("HireX Azure Wrapper - Python Path Setup")
@@ -0,0 +1,211 @@
+"""Tests for the pure helpers in ``resume_screening_rag_automation.main``."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from resume_screening_rag_automation import main  # noqa: E402
+from resume_screening_rag_automation.core.py_models import ConversationPhase  # noqa: E402
+
+JD = ConversationPhase.job_description
+SCREENING = ConversationPhase.screening
+DISCUSSION = ConversationPhase.discussion
+
+FLAG_NAMES = (
+    "new_job_search",
+    "update_jd",
+    "allow_jd_incomplete",
+    "jd_complete",
+    "screen_again",
+    "candidates_ready",
+)
+
+
+def _split_by_lines(message_md: str) -> dict:
+    """Line-by-line reference for ``_split_screening_message_sections``."""
+
+    summary_tokens = {"summary", "## summary", "### summary"}
+    recommendation_tokens = {"recommendations", "## recommendations", "### recommendations"}
+    table_lines, recommendation_lines = [], []
+    mode = "table"
+    for line in message_md.splitlines():
+        lowered = line.strip().lower()
+        if lowered in summary_tokens:
+            mode = "summary"
+        elif lowered in recommendation_tokens:
+            mode = "recommendations"
+        elif mode == "table":
+            table_lines.append(line)
+        elif mode == "recommendations":
+            recommendation_lines.append(line)
+    return {
+        "table": "\n".join(table_lines).strip(),
+        "recommendations": "\n".join(recommendation_lines).strip(),
+    }
+
+
+SCREENING_MESSAGE = "\n".join(
+    [
+        "| Candidate | Score |",
+        "| --- | --- |",
+        "| Ada | 0.91 |",
+        "",
+        "## Summary",
+        "Strong shortlist.",
+        "",
+        "### Recommendations",
+        "- Interview Ada first",
+        "- Ask about leadership",
+        "",
+    ]
+)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_split_screening_sections_normalises_line_endings(newline):
+    message = SCREENING_MESSAGE.replace("\n", newline)
+
+    sections = main._split_screening_message_sections(message)
+
+    assert sections == {
+        "table": "| Candidate | Score |\n| --- | --- |\n| Ada | 0.91 |",
+        "recommendations": "- Interview Ada first\n- Ask about leadership",
+    }
+    assert "\r" not in sections["table"]
+    assert "\r" not in sections["recommendations"]
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "",
+        "only a table",
+        "Recommendations",
+        "Summary\r\nignored\r\nRecommendations\r\n  indented\r\n\r\nlast",
+        "table\r\n  ## Summary  \r\nx\r\nRECOMMENDATIONS\r\na\r\nSummary\r\nb\r\nrecommendations\r\nc",
+        "#### Summary\nstays in the table\nSummaryx\nrecommendations",
+    ],
+)
+def test_split_screening_sections_matches_line_reference(message):
+    assert main._split_screening_message_sections(message) == _split_by_lines(message)
+
+
+def _controls_for_mask(mask: int) -> dict:
+    flags = {name: bool(mask & (1 << bit)) for bit, name in enumerate(FLAG_NAMES)}
+    flags["has_job_title"] = bool(mask & 64)
+    return flags
+
+
+def _reference_plan(requested, flags: dict) -> list:
+    """The sequential planning logic _calculate_execution_plan started from."""
+
+    plan = []
+    requested = list(requested)
+    needs_jd = flags["update_jd"] or flags["new_job_search"] or not flags["has_job_title"]
+    screening_ok = flags["allow_jd_incomplete"] or flags["jd_complete"] or flags["screen_again"]
+
+    if not requested:
+        if needs_jd:
+            requested = [JD]
+        elif screening_ok:
+            requested = [SCREENING]
+        elif flags["candidates_ready"]:
+            requested = [DISCUSSION]
+
+    sequential_requested = [phase.value for phase in requested] == [JD.value, SCREENING.value]
+
+    def include_job_description():
+        should_run = JD in requested and needs_jd
+        if should_run and JD not in plan:
+            plan.append(JD)
+        return should_run
+
+    def include_screening():
+        if SCREENING not in requested or not screening_ok:
+            return False
+        if SCREENING not in plan:
+            plan.append(SCREENING)
+        return True
+
+    def include_discussion():
+        if DISCUSSION not in requested or not flags["candidates_ready"]:
+            return False
+        if DISCUSSION not in plan:
+            plan.append(DISCUSSION)
+        return True
+
+    job_selected = include_job_description()
+
+    if sequential_requested:
+        if JD in requested and not job_selected:
+            plan.append(JD)
+        if flags["new_job_search"]:
+            return plan
+        if flags["update_jd"] and not (flags["allow_jd_incomplete"] or flags["jd_complete"]):
+            return plan
+        include_screening()
+        return plan
+
+    if not requested:
+        return plan
+
+    first = requested[0]
+    if first is JD:
+        if not job_selected:
+            include_job_description()
+    elif first is SCREENING:
+        include_screening()
+    elif first is DISCUSSION:
+        include_discussion()
+    return plan
+
+
+TABLE_SHAPES = [(), (JD,), (SCREENING,), (DISCUSSION,), (JD, SCREENING)]
+
+# Every ordering of up to three phases, repeats included, so shapes outside
+# the precomputed table exercise the _plan_for fallback as well.
+ALL_SHAPES = [
+    shape
+    for length in range(4)
+    for shape in itertools.product((JD, SCREENING, DISCUSSION), repeat=length)
+]
+
+
+def _calculate_plan(requested, flags: dict) -> list:
+    controls = SimpleNamespace(
+        phase_sequence=[phase.value for phase in requested],
+        **{name: flags[name] for name in FLAG_NAMES},
+    )
+    job_title = "Data Engineer" if flags["has_job_title"] else None
+    flow = SimpleNamespace(
+        state=SimpleNamespace(chat_state=SimpleNamespace(job_snapshot=SimpleNamespace(job_title=job_title))),
+        _logger=logging.getLogger("test.planner"),
+        _log_skipped_phases=lambda *args: None,
+    )
+    routing = SimpleNamespace(query_controls=controls)
+    return main.ResumeAssistantFlow._calculate_execution_plan(flow, routing)
+
+
+@pytest.mark.parametrize("shape", TABLE_SHAPES, ids=lambda shape: "+".join(p.value for p in shape) or "empty")
+def test_plan_table_matches_reference_for_every_mask(shape):
+    for mask in range(128):
+        expected = _reference_plan(shape, _controls_for_mask(mask))
+        assert list(main._PLAN_TABLE[(shape, mask)]) == expected, mask
+
+
+@pytest.mark.parametrize("shape", ALL_SHAPES, ids=lambda shape: "+".join(p.value for p in shape) or "empty")
+def test_calculate_execution_plan_matches_reference(shape):
+    for mask in range(128):
+        flags = _controls_for_mask(mask)
+        assert _calculate_plan(shape, flags) == _reference_plan(shape, flags), mask
+
+
+def test_plan_table_covers_only_the_listed_shapes():
+    assert {shape for shape, _ in main._PLAN_TABLE} == set(TABLE_SHAPES)
+    assert len(main._PLAN_TABLE) == len(TABLE_SHAPES) * 128